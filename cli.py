@@ -45,17 +45,10 @@ class InspectOptions:
     config_path: Path | None
     only_exts: list[str]
     log_path: Path | None
+    override_existing: bool = False
 
 
-def _parse_run_args(argv: list[str] | None = None) -> argparse.Namespace:
-    """Parse CLI arguments for the run command.
-
-    Args:
-        argv: Optional argument list.
-
-    Returns:
-        Parsed argparse namespace.
-    """
+def _build_run_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Tag movie files using TMDb metadata.")
     _add_common_args(parser)
     parser.add_argument("--restore-backup", help="Restore metadata from backup run directory")
@@ -77,7 +70,31 @@ def _parse_run_args(argv: list[str] | None = None) -> argparse.Namespace:
         choices=["basic", "verbose"],
         help="Test mode: basic or verbose (default: basic)",
     )
-    return parser.parse_args(argv)
+    return parser
+
+
+def _build_inspect_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Inspect movie files for missing metadata.")
+    _add_common_args(parser)
+    parser.add_argument("--log", help="Write missing metadata report to this path")
+    return parser
+
+
+# Parsers are built once; parse_args does not mutate them.
+_RUN_PARSER = _build_run_parser()
+_INSPECT_PARSER = _build_inspect_parser()
+
+
+def _parse_run_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse CLI arguments for the run command.
+
+    Args:
+        argv: Optional argument list.
+
+    Returns:
+        Parsed argparse namespace.
+    """
+    return _RUN_PARSER.parse_args(argv)
 
 
 def _parse_inspect_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -89,10 +106,7 @@ def _parse_inspect_args(argv: list[str] | None = None) -> argparse.Namespace:
     Returns:
         Parsed argparse namespace.
     """
-    parser = argparse.ArgumentParser(description="Inspect movie files for missing metadata.")
-    _add_common_args(parser)
-    parser.add_argument("--log", help="Write missing metadata report to this path")
-    return parser.parse_args(argv)
+    return _INSPECT_PARSER.parse_args(argv)
 
 
 def _normalize_only_exts(raw_values: Iterable[str] | None) -> list[str]:
@@ -134,10 +148,10 @@ def resolve_config_path(args: argparse.Namespace) -> Path | None:
     """
     if args.config:
         return Path(args.config).expanduser().resolve()
-    default_file = Path.cwd() / "config.json"
-    if default_file.exists():
-        return default_file.resolve()
-    return None
+    try:
+        return (Path.cwd() / "config.json").resolve(strict=True)
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
 
 def get_run_options(argv: list[str] | None = None) -> RunOptions:
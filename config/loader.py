@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -18,6 +19,8 @@ MODULE_CONFIG_PATHS = {
     "write": BASE_DIR / "ffmpeg" / "config.json",
 }
 
+_RAW_CONFIG_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
 
 def _as_list(value: Any) -> List[str]:
     if not value:
@@ -123,9 +126,35 @@ def config_from_dict(raw: Dict[str, Any]) -> Config:
     )
 
 
+def _stat_key(path: Path) -> tuple[str, int, int] | None:
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (str(path), st.st_mtime_ns, st.st_size)
+
+
 def load_config(path: Path | None) -> Config:
-    """Load config data into a Config instance."""
-    raw = _load_default_sections()
-    if path is not None:
-        raw = merge_sections(raw, _load_json(path))
-    return config_from_dict(raw)
+    """Load config data into a Config instance.
+
+    Parsed JSON is cached per file identity (path, mtime, size), so repeated
+    loads of unchanged files skip parsing. A fresh Config is built on every
+    call, so callers may mutate the result. When the config carries no
+    ``tmdb.api_key``, the key is read from ``tmdb.api_key_env`` here, once per
+    load.
+    """
+    key = (
+        tuple(_stat_key(file_path) for file_path in MODULE_CONFIG_PATHS.values()),
+        _stat_key(path) if path is not None else None,
+    )
+    raw = _RAW_CONFIG_CACHE.get(key)
+    if raw is None:
+        raw = _load_default_sections()
+        if path is not None:
+            raw = merge_sections(raw, _load_json(path))
+        _RAW_CONFIG_CACHE.clear()
+        _RAW_CONFIG_CACHE[key] = raw
+    cfg = config_from_dict(raw)
+    if not cfg.tmdb.api_key:
+        cfg.tmdb.api_key = os.environ.get(cfg.tmdb.api_key_env, "")
+    return cfg
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Iterable, List
 
@@ -52,15 +53,35 @@ def find_movie_files(root: Path, extensions: List[str], ignore_substrings: List[
     Returns:
         List of movie file paths.
     """
+    ext_set = frozenset(extensions)
+    ignore_lower = [s.lower() for s in ignore_substrings]
     files: List[Path] = []
-    for p in root.rglob("*"):
-        if not p.is_file():
+    # Depth-first, directory entries before subdirectories, like rglob("*").
+    # DirEntry type checks reuse readdir data, so most files cost no stat().
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                entries = list(it)
+        except OSError:
             continue
-        if p.suffix.lower() not in extensions:
-            continue
-        if should_ignore(p, ignore_substrings):
-            continue
-        files.append(p)
-        if max_files and len(files) >= max_files:
-            break
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                if not entry.is_file():
+                    continue
+            except OSError:
+                continue
+            name = entry.name.lower()
+            if os.path.splitext(name)[1] not in ext_set:
+                continue
+            if any(s in name for s in ignore_lower):
+                continue
+            files.append(Path(entry.path))
+            if max_files and len(files) >= max_files:
+                return files
+        stack.extend(reversed(subdirs))
     return files
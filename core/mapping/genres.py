@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Iterable, List
 
 
@@ -32,12 +34,16 @@ _CANONICAL_GENRES = [
 ]
 
 
+_SEPARATOR_RE = re.compile(r"[/_]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
 def _normalize_key(value: str) -> str:
     lowered = value.strip().lower()
     lowered = lowered.replace("&", "and")
     lowered = lowered.replace("-", " ")
-    lowered = re.sub(r"[/_]", " ", lowered)
-    lowered = re.sub(r"\s+", " ", lowered)
+    lowered = _SEPARATOR_RE.sub(" ", lowered)
+    lowered = _WHITESPACE_RE.sub(" ", lowered)
     return lowered
 
 
@@ -77,6 +83,15 @@ TMDB_TO_ITUNES = {
 
 _TMDB_LOOKUP = {_normalize_key(key): value for key, value in TMDB_TO_ITUNES.items()}
 
+# Normalized key -> canonical genre; TMDb aliases win over canonical names.
+_GENRE_LOOKUP = MappingProxyType(
+    {
+        key: value
+        for key, value in {**_CANONICAL_LOOKUP, **_TMDB_LOOKUP}.items()
+        if value in _CANONICAL_GENRES
+    }
+)
+
 _PRIORITY_ORDER = [
     "Documentary",
     "Animation",
@@ -97,6 +112,11 @@ _PRIORITY_ORDER = [
 _PRIORITY_INDEX = {name: idx for idx, name in enumerate(_PRIORITY_ORDER)}
 
 
+@lru_cache(maxsize=512)
+def _lookup_genre(raw_text: str) -> str | None:
+    return _GENRE_LOOKUP.get(_normalize_key(raw_text))
+
+
 def normalize_genres(genres: Iterable[str], max_genres: int = 2) -> List[str]:
     """Normalize genre names to the canonical list while preserving order."""
     normalized: List[str] = []
@@ -109,9 +129,8 @@ def normalize_genres(genres: Iterable[str], max_genres: int = 2) -> List[str]:
         raw_text = str(raw)
         if "&" in raw_text:
             compound_present = True
-        key = _normalize_key(raw_text)
-        mapped = _TMDB_LOOKUP.get(key) or _CANONICAL_LOOKUP.get(key)
-        if not mapped or mapped in seen or mapped not in _CANONICAL_GENRES:
+        mapped = _lookup_genre(raw_text)
+        if not mapped or mapped in seen:
             continue
         normalized.append(mapped)
         seen.add(mapped)
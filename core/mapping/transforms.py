@@ -402,11 +402,15 @@ def download_tmdb_image_to_file(
     tmdb_path: str,
     out_path: Path,
     config: TMDbImageDownloadConfig = TMDbImageDownloadConfig(),
+    session: Any = None,
 ) -> Path:
     """
     Download a TMDb image (poster/backdrop) given its path (e.g., '/abc123.jpg')
     and write it to out_path. Returns out_path.
 
+    Pass the run's requests session to reuse its pooled connections; without
+    one, a standalone request is made.
+
     Requires: pip install requests
     """
     if requests is None:  # pragma: no cover
@@ -424,7 +428,14 @@ def download_tmdb_image_to_file(
     out_path = out_path.expanduser().resolve()
     out_path.parent.mkdir(parents=True, exist_ok=True)
 
-    r = requests.get(url, timeout=config.timeout_seconds)
-    r.raise_for_status()
-    out_path.write_bytes(r.content)
+    get = session.get if session is not None else requests.get
+    with get(url, timeout=config.timeout_seconds, stream=True) as r:
+        r.raise_for_status()
+        try:
+            with out_path.open("wb") as fh:
+                for chunk in r.iter_content(64 * 1024):
+                    fh.write(chunk)
+        except BaseException:
+            out_path.unlink(missing_ok=True)
+            raise
     return out_path
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Set, Union
 
@@ -53,44 +54,35 @@ def load_plan(path: Path) -> Dict[str, Any]:
 
 
 
-def _apply_part(value: Any, part: str) -> Any:
-    if "[" not in part:
-        if isinstance(value, list):
-            return [item.get(part) for item in value if isinstance(item, dict) and part in item]
-        if isinstance(value, dict):
-            return value.get(part)
-        return None
+_BRACKET_PART_RE = re.compile(r"^(?P<key>[^\[]+)\[(?P<select>.*)\]$")
+_FILTER_SELECTOR_RE = re.compile(r"^\?\(@\.(?P<field>[^=]+)==['\"](?P<target>.+?)['\"]\)$")
+
+# Parsed path step: (kind, key, index, field, target).
+_Step = tuple[str, str, int, str, str]
+
 
-    match = re.match(r"^(?P<key>[^\[]+)\[(?P<select>.*)\]$", part)
+@lru_cache(maxsize=1024)
+def _parse_part(part: str) -> _Step:
+    if "[" not in part:
+        return ("key", part, 0, "", "")
+    match = _BRACKET_PART_RE.match(part)
     if not match:
-        return None
+        return ("invalid", "", 0, "", "")
     key = match.group("key")
     selector = match.group("select")
-
-    if isinstance(value, dict):
-        value = value.get(key)
-    elif key:
-        return None
-
-    if not isinstance(value, list):
-        return []
-
     if selector == "*":
-        return value
+        return ("all", key, 0, "", "")
     if selector.isdigit():
-        idx = int(selector)
-        return value[idx] if 0 <= idx < len(value) else None
-
-    filter_match = re.match(r"^\?\(@\.(?P<field>[^=]+)==['\"](?P<target>.+?)['\"]\)$", selector)
+        return ("index", key, int(selector), "", "")
+    filter_match = _FILTER_SELECTOR_RE.match(selector)
     if filter_match:
-        field = filter_match.group("field")
-        target = filter_match.group("target")
-        return [item for item in value if isinstance(item, dict) and str(item.get(field)) == target]
-    return []
+        return ("filter", key, 0, filter_match.group("field"), filter_match.group("target"))
+    return ("unsupported", key, 0, "", "")
 
 
-def extract_jsonpath(payload: Any, jsonpath: str) -> Any:
-    """Extract a value from a payload using a minimal JSONPath subset."""
+@lru_cache(maxsize=1024)
+def _parse_jsonpath(jsonpath: str) -> tuple[_Step, ...] | None:
+    """Split and parse a JSONPath once; plans reuse a small set of paths."""
     if not jsonpath.startswith("$."):
         return None
     parts: list[str] = []
@@ -108,9 +100,45 @@ def extract_jsonpath(payload: Any, jsonpath: str) -> Any:
         buffer.append(ch)
     if buffer:
         parts.append("".join(buffer))
+    return tuple(_parse_part(part) for part in parts)
+
+
+def _apply_step(value: Any, step: _Step) -> Any:
+    kind, key, index, field, target = step
+    if kind == "key":
+        if isinstance(value, list):
+            return [item.get(key) for item in value if isinstance(item, dict) and key in item]
+        if isinstance(value, dict):
+            return value.get(key)
+        return None
+    if kind == "invalid":
+        return None
+
+    if isinstance(value, dict):
+        value = value.get(key)
+    elif key:
+        return None
+
+    if not isinstance(value, list):
+        return []
+
+    if kind == "all":
+        return value
+    if kind == "index":
+        return value[index] if 0 <= index < len(value) else None
+    if kind == "filter":
+        return [item for item in value if isinstance(item, dict) and str(item.get(field)) == target]
+    return []
+
+
+def extract_jsonpath(payload: Any, jsonpath: str) -> Any:
+    """Extract a value from a payload using a minimal JSONPath subset."""
+    steps = _parse_jsonpath(jsonpath)
+    if steps is None:
+        return None
     current: Any = payload
-    for part in parts:
-        current = _apply_part(current, part)
+    for step in steps:
+        current = _apply_step(current, step)
         if current is None:
             return None
     return current
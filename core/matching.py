@@ -4,9 +4,46 @@ from __future__ import annotations
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List, Tuple
 
 
+_INNER_HYPHEN_RE = re.compile(r"(?<=\w)-(?=\w)")
+_YEAR_RE = re.compile(r"\b(19\d{2}|20\d{2})\b")
+_BRACKETED_RE = re.compile(r"[\[(].*?[\])]")
+_SEASON_VOLUME_RE = re.compile(r"\b[sS]\d+[vV]\d+\b")
+_DISC_RE = re.compile(r"\b(?:disc|cd)\s*\d+\b", re.IGNORECASE)
+_WHITESPACE_RE = re.compile(r"\s+")
+_VOLUME_TOKEN_RE = re.compile(r"v\d{1,2}", re.IGNORECASE)
+_SEASON_DISC_TOKEN_RE = re.compile(r"[sd]\d{1,2}", re.IGNORECASE)
+_TITLE_SPLIT_RE = re.compile(r"\s*[-:]\s*")
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+_ACRONYM_MAP = {
+    "lotr": "Lord of the Rings",
+}
+_EDITION_TOKENS = frozenset(
+    {
+        "ext",
+        "extended",
+        "unrated",
+        "ws",
+        "se",
+        "dc",
+        "special",
+        "edition",
+        "remastered",
+        "ultimate",
+        "cut",
+    }
+)
+
+
+@lru_cache(maxsize=32)
+def _strip_token_set(strip_tokens: Tuple[str, ...]) -> frozenset[str]:
+    return frozenset(t.lower() for t in strip_tokens) | _EDITION_TOKENS
+
+
 def clean_filename_for_search(stem: str, strip_tokens: List[str]) -> Tuple[str, int | None]:
     """Extract a movie title and year guess from a filename stem.
 
@@ -18,62 +55,44 @@ def clean_filename_for_search(stem: str, strip_tokens: List[str]) -> Tuple[str,
         Tuple of (title, year) where year may be None.
     """
     s = stem.replace("_", " ").replace(".", " ")
-    s = re.sub(r"(?<=\w)-(?=\w)", "__HYPHEN__", s)
+    s = _INNER_HYPHEN_RE.sub("__HYPHEN__", s)
     s = s.replace("-", " ").replace("__HYPHEN__", "-")
     year = None
-    m = re.search(r"\b(19\d{2}|20\d{2})\b", s)
+    m = _YEAR_RE.search(s)
     if m:
         year = int(m.group(1))
-        s = re.sub(r"\b(19\d{2}|20\d{2})\b", " ", s)
+        s = _YEAR_RE.sub(" ", s)
     # Remove bracketed edition notes like [WS] or (Unrated)
-    s = re.sub(r"[\[(].*?[\])]", " ", s)
+    s = _BRACKETED_RE.sub(" ", s)
     # Remove common season/disc/volume bundles like S1V1
-    s = re.sub(r"\b[sS]\d+[vV]\d+\b", " ", s)
+    s = _SEASON_VOLUME_RE.sub(" ", s)
     # Normalize disc/cd markers like "Disc 1" or "CD2"
-    s = re.sub(r"\b(?:disc|cd)\s*\d+\b", " ", s, flags=re.IGNORECASE)
-    s = re.sub(r"\s+", " ", s).strip()
+    s = _DISC_RE.sub(" ", s)
+    s = _WHITESPACE_RE.sub(" ", s).strip()
 
-    acronym_map = {
-        "lotr": "Lord of the Rings",
-    }
     expanded_parts = []
     for part in s.split():
-        replacement = acronym_map.get(part.lower())
+        replacement = _ACRONYM_MAP.get(part.lower())
         if replacement:
             expanded_parts.extend(replacement.split())
         else:
             expanded_parts.append(part)
 
-    tokens = set(t.lower() for t in strip_tokens)
-    extra_tokens = {
-        "ext",
-        "extended",
-        "unrated",
-        "ws",
-        "se",
-        "dc",
-        "special",
-        "edition",
-        "remastered",
-        "ultimate",
-        "cut",
-    }
+    tokens = _strip_token_set(tuple(strip_tokens))
     parts = []
     for part in expanded_parts:
         if part.lower() in tokens:
             continue
-        if part.lower() in extra_tokens:
-            continue
-        if re.fullmatch(r"v\d{1,2}", part, flags=re.IGNORECASE):
+        if _VOLUME_TOKEN_RE.fullmatch(part):
             parts.append("Vol")
             parts.append(part[1:])
             continue
-        if re.fullmatch(r"[sd]\d{1,2}", part, flags=re.IGNORECASE):
+        if _SEASON_DISC_TOKEN_RE.fullmatch(part):
             continue
         parts.append(part)
 
     title = " ".join(parts).strip()
-    title = re.sub(r"\s+", " ", title)
+    title = _WHITESPACE_RE.sub(" ", title)
     return title, year
 
 
@@ -93,10 +112,13 @@ _EXTRAS_TOKENS = {
 }
 
 
+def _strip_diacritics(value: str) -> str:
+    normalized = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in normalized if not unicodedata.combining(ch))
+
+
 def _tokenize_title(title: str) -> List[str]:
-    normalized = unicodedata.normalize("NFKD", title)
-    normalized = "".join(ch for ch in normalized if not unicodedata.combining(ch))
-    return re.findall(r"[a-z0-9]+", normalized.lower())
+    return _WORD_RE.findall(_strip_diacritics(title).lower())
 
 
 def is_extras_title(title: str) -> bool:
@@ -111,7 +133,7 @@ def build_search_candidates(title: str) -> List[str]:
     if title:
         candidates.append(title)
 
-    for part in re.split(r"\s*[-:]\s*", title):
+    for part in _TITLE_SPLIT_RE.split(title):
         part = part.strip()
         if part and part != title:
             candidates.append(part)
@@ -124,16 +146,13 @@ def build_search_candidates(title: str) -> List[str]:
     if len(tokens) == 1:
         candidates.append(tokens[-1])
 
-    def strip_diacritics(value: str) -> str:
-        normalized = unicodedata.normalize("NFKD", value)
-        return "".join(ch for ch in normalized if not unicodedata.combining(ch))
-
-    unique: List[str] = []
+    # Insertion-ordered dict keys dedupe in O(1) while keeping search order.
+    unique: dict[str, None] = {}
     for candidate in candidates:
-        cleaned = re.sub(r"\s+", " ", candidate).strip()
-        if cleaned and cleaned not in unique:
-            unique.append(cleaned)
-        deaccented = strip_diacritics(cleaned)
-        if deaccented and deaccented not in unique:
-            unique.append(deaccented)
-    return unique
+        cleaned = _WHITESPACE_RE.sub(" ", candidate).strip()
+        if cleaned:
+            unique[cleaned] = None
+        deaccented = _strip_diacritics(cleaned)
+        if deaccented:
+            unique[deaccented] = None
+    return list(unique)
@@ -149,11 +149,12 @@ def inspect(root: Path, file_path: Path | None, cfg: Config, only_exts: list[str
     )
     if files is None:
         return InspectReport(total_files=0, files_with_missing=0, total_missing_fields=0)
-    log.info(f"Found {len(files)} file(s).")
+    log.info("Found %d file(s).", len(files))
     log_file = _resolve_log_path(log_path, cfg)
     required = _load_required_keys()
     ffprobe_path = resolve_ffprobe_path(cfg.write.ffmpeg_path)
     inspector = MediaInspector(ffprobe_path)
+    inspector.prewarm(files)
     check_artwork = cfg.write.cover_art_enabled
     rdns_namespace = cfg.write.rdns_namespace
 
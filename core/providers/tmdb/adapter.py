@@ -9,7 +9,7 @@ from typing import Any, Dict, TYPE_CHECKING
 from core.mapping import transforms
 from core.mapping.transforms import TMDbImageDownloadConfig
 from core.providers.adapter import MappingProvider
-from core.providers.tmdb.client import tmdb_request
+from core.providers.tmdb.client import is_cached_request, tmdb_request
 from core.providers.tmdb.helpers import select_image_size
 from logger import get_logger
 
@@ -58,8 +58,9 @@ class TmdbMappingProvider(MappingProvider):
             )
             params: Dict[str, Any] = {"language": ctx.language, "include_adult": ctx.include_adult}
             try:
+                cached = is_cached_request(ctx.session, resolved, params)
                 payloads[endpoint] = tmdb_request(ctx.session, ctx.api_key, resolved, params)
-                if ctx.request_delay:
+                if ctx.request_delay and not cached:
                     time.sleep(ctx.request_delay)
             except Exception as exc:
                 log.info(f"  ⚠️ TMDb fetch failed for {resolved}: {exc}")
@@ -81,7 +82,9 @@ class TmdbMappingProvider(MappingProvider):
         base_url = ctx.image_base_url.rstrip("/") + "/" + size
         config = TMDbImageDownloadConfig(base_url=base_url)
         try:
-            return transforms.download_tmdb_image_to_file(str(path), out_path, config=config)
+            return transforms.download_tmdb_image_to_file(
+                str(path), out_path, config=config, session=ctx.session
+            )
         except Exception as exc:
             log.info(f"  ⚠️ Cover art download failed: {exc}")
             return None
@@ -110,7 +113,9 @@ class TmdbMappingProvider(MappingProvider):
         base_url = ctx.image_base_url.rstrip("/") + "/" + size
         config = TMDbImageDownloadConfig(base_url=base_url)
         try:
-            return transforms.download_tmdb_image_to_file(str(tmdb_path), out_path, config=config)
+            return transforms.download_tmdb_image_to_file(
+                str(tmdb_path), out_path, config=config, session=ctx.session
+            )
         except Exception as exc:
             log.info(f"  ⚠️ Cover art download failed: {exc}")
             return None
@@ -5,13 +5,69 @@ from __future__ import annotations
 import re
 import unicodedata
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable
 
 import requests
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional dependency for faster TMDb response decoding
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
 
 TMDB_BASE = "https://api.themoviedb.org/3"
+_SESSION_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip"}
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+
+
+class TmdbSession(requests.Session):
+    """Requests session that remembers TMDb API responses for its lifetime.
+
+    A run searches the same titles repeatedly (every episode of a show, or
+    several cuts of one movie), so identical requests are answered from
+    memory instead of the network.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.response_cache: Dict[tuple, Dict[str, Any]] = {}
+
+
+def create_tmdb_session() -> TmdbSession:
+    """Create a requests session configured for TMDb API calls.
+
+    Default headers are set once on the session and a pooled adapter with
+    retry/backoff for transient errors is mounted for HTTPS.
+
+    Returns:
+        Configured requests session.
+    """
+    session = TmdbSession()
+    session.headers.update(_SESSION_HEADERS)
+    # raise_on_status=False hands the last 429/5xx response back so callers
+    # still get requests.HTTPError from raise_for_status(), not RetryError.
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=_RETRY_STATUSES, raise_on_status=False)
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries))
+    return session
+
+
+def _cache_key(endpoint: str, params: Dict[str, Any]) -> tuple:
+    return (endpoint, tuple(sorted(params.items())))
+
+
+def is_cached_request(session: requests.Session, endpoint: str, params: Dict[str, Any]) -> bool:
+    """Return True if ``tmdb_request`` would answer from the session cache.
+
+    Callers use this to skip request pacing for responses that never touch
+    the network.
+    """
+    cache = getattr(session, "response_cache", None)
+    return cache is not None and _cache_key(endpoint, params) in cache
 
 
 def tmdb_request(session: requests.Session, api_key: str, endpoint: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -24,14 +80,20 @@ def tmdb_request(session: requests.Session, api_key: str, endpoint: str, params:
         params: Query parameters.
 
     Returns:
-        Parsed JSON response.
+        Parsed JSON response. Responses are reused for identical requests on
+        a ``TmdbSession``; callers must not mutate them.
     """
+    cache = getattr(session, "response_cache", None)
+    key = _cache_key(endpoint, params)
+    if cache is not None and key in cache:
+        return cache[key]
     url = f"{TMDB_BASE}{endpoint}"
-    params = dict(params)
-    params["api_key"] = api_key
-    resp = session.get(url, params=params, timeout=20)
+    resp = session.get(url, params={**params, "api_key": api_key}, timeout=20)
     resp.raise_for_status()
-    return resp.json()
+    data = orjson.loads(resp.content) if orjson is not None else resp.json()
+    if cache is not None:
+        cache[key] = data
+    return data
 
 
 def tmdb_configuration(session: requests.Session, api_key: str) -> Dict[str, Any]:
@@ -39,9 +101,13 @@ def tmdb_configuration(session: requests.Session, api_key: str) -> Dict[str, Any
     return tmdb_request(session, api_key, "/configuration", {})
 
 
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
     """Normalize a title for fuzzy matching.
 
+    Results are memoized; search candidates and TMDb result titles repeat
+    across endpoints and files.
+
     Args:
         title: Title to normalize.
 
@@ -49,11 +115,14 @@ def normalize_title(title: str) -> str:
         Normalized title string.
     """
     lowered = title.lower()
-    lowered = unicodedata.normalize("NFKD", lowered)
-    lowered = "".join(ch for ch in lowered if not unicodedata.combining(ch))
+    if not lowered.isascii():
+        # NFKD and combining-mark removal are no-ops on ASCII titles.
+        lowered = unicodedata.normalize("NFKD", lowered)
+        lowered = "".join(ch for ch in lowered if not unicodedata.combining(ch))
     lowered = lowered.replace("&", "and")
-    lowered = re.sub(r"[^a-z0-9]+", " ", lowered)
-    return re.sub(r"\s+", " ", lowered).strip()
+    # Each non-alphanumeric run (whitespace included) becomes one space, so
+    # no separate whitespace-collapsing pass is needed.
+    return _NON_ALNUM_RE.sub(" ", lowered).strip()
 
 
 def title_similarity(left: str, right: str) -> float:
@@ -99,7 +168,7 @@ def tmdb_search_best_match_with_candidates(
     return candidate.result
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MatchCandidate:
     """Scored TMDb candidate match."""
 
@@ -129,6 +198,11 @@ def _best_match_with_candidates(
     best_score = -1.0
     best_votes = 0
     best_popularity = 0.0
+    # Scores are on a 0-10 scale (QRatio / 10). A result below both
+    # thresholds can never be accepted, so rapidfuzz may skip it early; the
+    # epsilon keeps boundary scores that the checks below would accept.
+    ratio_cutoff = max(0.0, min(min_score, fallback_min_score) * 10.0 - 1e-6)
+    primary_key, fallback_key = title_keys
     for title in titles:
         if not title:
             continue
@@ -140,12 +214,17 @@ def _best_match_with_candidates(
         if not results:
             continue
 
-        def score(r: Dict[str, Any]) -> float:
-            result_title = str(r.get(title_keys[0]) or r.get(title_keys[1]) or "")
-            return title_similarity(title, result_title) * 10.0
-
-        candidate_best = max(results, key=score)
-        candidate_score = score(candidate_best)
+        choices = [normalize_title(str(r.get(primary_key) or r.get(fallback_key) or "")) for r in results]
+        # extractOne scores every result in one native call and keeps the
+        # first best match, like max(); the winner is not re-scored.
+        match = process.extractOne(
+            normalize_title(title), choices, scorer=fuzz.QRatio, processor=None, score_cutoff=ratio_cutoff
+        )
+        if match is None:
+            continue
+        _choice, ratio, index = match
+        candidate_best = results[index]
+        candidate_score = ratio / 100.0 * 10.0
         candidate_votes = int(candidate_best.get("vote_count") or 0)
         candidate_popularity = float(candidate_best.get("popularity") or 0.0)
         if candidate_score > best_score:
@@ -14,6 +14,8 @@ from logger import get_logger
 
 log = get_logger()
 
+_CHUNK_SIZE = 64 * 1024
+
 
 def select_image_size(available: List[str], preferred: str) -> str:
     """Select the best image size.
@@ -65,14 +67,22 @@ def download_cover_art(session: requests.Session, url: str, suffix: str) -> Path
     """
     if not url:
         return None
+    tmp_path: Path | None = None
     try:
-        resp = session.get(url, timeout=20)
-        resp.raise_for_status()
-        fd, tmp_name = tempfile.mkstemp(prefix="cover.", suffix=suffix or ".jpg")
-        os.close(fd)
-        tmp_path = Path(tmp_name)
-        tmp_path.write_bytes(resp.content)
+        with session.get(url, timeout=20, stream=True) as resp:
+            resp.raise_for_status()
+            fd, tmp_name = tempfile.mkstemp(prefix="cover.", suffix=suffix or ".jpg")
+            tmp_path = Path(tmp_name)
+            with os.fdopen(fd, "wb") as fh:
+                for chunk in resp.iter_content(_CHUNK_SIZE):
+                    fh.write(chunk)
         return tmp_path
     except requests.RequestException as e:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
         log.info(f"  ❌ Failed to download cover art: {e}")
         return None
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
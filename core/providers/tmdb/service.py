@@ -80,7 +80,7 @@ def init_tmdb(
     include_adult = bool(cfg.tmdb.include_adult)
     min_score = float(cfg.tmdb.min_score)
     delay = float(cfg.tmdb.request_delay_seconds)
-    session = requests.Session()
+    session = tmdb_client.create_tmdb_session()
     image_base_url = ""
     poster_sizes: list[str] = []
 
@@ -9,7 +9,17 @@ from core.mapping.genres import normalize_genres
 from core.models.mp4 import Mp4Metadata
 
 
-@dataclass(frozen=True)
+def _names(items: Any, key: str = "name") -> list[str]:
+    """Return the non-empty ``key`` values from a list of TMDb objects."""
+    return [value for value in (item.get(key) for item in items or []) if value]
+
+
+def _join_names(items: Any, key: str = "name") -> str:
+    """Join the non-empty ``key`` values from a list of TMDb objects."""
+    return ", ".join(_names(items, key))
+
+
+@dataclass(frozen=True, slots=True)
 class BaseTmdbMetadata:
     """Shared metadata fields derived from TMDb payloads."""
 
@@ -63,7 +73,7 @@ class BaseTmdbMetadata:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TmdbMovieMetadata(BaseTmdbMetadata):
     """Normalized movie metadata derived from TMDb."""
 
@@ -82,24 +92,11 @@ class TmdbMovieMetadata(BaseTmdbMetadata):
 
         tagline = Mp4Metadata.normalize_text(movie.get("tagline"))
 
-        genres = movie.get("genres") or []
-        genres_joined = ", ".join(normalize_genres(g.get("name", "") for g in genres if g.get("name")))
-
-        companies = movie.get("production_companies") or []
-        production_companies_joined = ", ".join(c.get("name", "") for c in companies if c.get("name"))
-
-        origin_countries = movie.get("origin_country") or []
-        origin_countries_joined = ", ".join(str(c) for c in origin_countries if c)
-
-        production_countries = movie.get("production_countries") or []
-        production_countries_joined = ", ".join(
-            c.get("name", "") for c in production_countries if c.get("name")
-        )
-
-        spoken_languages = movie.get("spoken_languages") or []
-        spoken_languages_joined = ", ".join(
-            lang.get("english_name", "") for lang in spoken_languages if lang.get("english_name")
-        )
+        genres_joined = ", ".join(normalize_genres(_names(movie.get("genres"))))
+        production_companies_joined = _join_names(movie.get("production_companies"))
+        origin_countries_joined = ", ".join(str(c) for c in movie.get("origin_country") or [] if c)
+        production_countries_joined = _join_names(movie.get("production_countries"))
+        spoken_languages_joined = _join_names(movie.get("spoken_languages"), "english_name")
 
         collection = movie.get("belongs_to_collection") or {}
         collection_name = ""
@@ -136,18 +133,14 @@ class TmdbMovieMetadata(BaseTmdbMetadata):
 
     def to_context(self) -> Dict[str, str]:
         """Convert the metadata into a template context mapping."""
-        ctx = super().to_context()
-        ctx.update(
-            {
-                "budget": self.budget,
-                "revenue": self.revenue,
-                "collection_name": self.collection_name,
-            }
-        )
+        ctx = BaseTmdbMetadata.to_context(self)
+        ctx["budget"] = self.budget
+        ctx["revenue"] = self.revenue
+        ctx["collection_name"] = self.collection_name
         return ctx
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TmdbTvMetadata(BaseTmdbMetadata):
     """Normalized TV metadata derived from TMDb."""
 
@@ -167,27 +160,12 @@ class TmdbTvMetadata(BaseTmdbMetadata):
 
         tagline = Mp4Metadata.normalize_text(show.get("tagline"))
 
-        genres = show.get("genres") or []
-        genres_joined = ", ".join(normalize_genres(g.get("name", "") for g in genres if g.get("name")))
-
-        companies = show.get("production_companies") or []
-        production_companies_joined = ", ".join(c.get("name", "") for c in companies if c.get("name"))
-        if not production_companies_joined:
-            networks = show.get("networks") or []
-            production_companies_joined = ", ".join(n.get("name", "") for n in networks if n.get("name"))
-
-        origin_countries = show.get("origin_country") or []
-        origin_countries_joined = ", ".join(str(c) for c in origin_countries if c)
-
-        production_countries = show.get("production_countries") or []
-        production_countries_joined = ", ".join(
-            c.get("name", "") for c in production_countries if c.get("name")
-        )
-
-        spoken_languages = show.get("spoken_languages") or []
-        spoken_languages_joined = ", ".join(
-            lang.get("english_name", "") for lang in spoken_languages if lang.get("english_name")
-        )
+        genres_joined = ", ".join(normalize_genres(_names(show.get("genres"))))
+        networks_joined = _join_names(show.get("networks"))
+        production_companies_joined = _join_names(show.get("production_companies")) or networks_joined
+        origin_countries_joined = ", ".join(str(c) for c in show.get("origin_country") or [] if c)
+        production_countries_joined = _join_names(show.get("production_countries"))
+        spoken_languages_joined = _join_names(show.get("spoken_languages"), "english_name")
 
         runtime = ""
         episode_runtime_value = ""
@@ -196,9 +174,6 @@ class TmdbTvMetadata(BaseTmdbMetadata):
             episode_runtime_value = Mp4Metadata.normalize_text(episode_runtime[0])
             runtime = episode_runtime_value
 
-        networks = show.get("networks") or []
-        networks_joined = ", ".join(n.get("name", "") for n in networks if n.get("name"))
-
         return cls(
             media_type="tv",
             tmdb_id=Mp4Metadata.normalize_text(show.get("id")),
@@ -230,13 +205,9 @@ class TmdbTvMetadata(BaseTmdbMetadata):
 
     def to_context(self) -> Dict[str, str]:
         """Convert the metadata into a template context mapping."""
-        ctx = super().to_context()
-        ctx.update(
-            {
-                "networks_joined": self.networks_joined,
-                "number_of_seasons": self.number_of_seasons,
-                "number_of_episodes": self.number_of_episodes,
-                "episode_runtime": self.episode_runtime,
-            }
-        )
+        ctx = BaseTmdbMetadata.to_context(self)
+        ctx["networks_joined"] = self.networks_joined
+        ctx["number_of_seasons"] = self.number_of_seasons
+        ctx["number_of_episodes"] = self.number_of_episodes
+        ctx["episode_runtime"] = self.episode_runtime
         return ctx
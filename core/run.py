@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
@@ -18,16 +19,22 @@ from core.mapping.plan_runner import apply_plan_for_file, load_movie_plan, load_
 from core.providers.tmdb.view_models import TmdbMovieMetadata, TmdbTvMetadata
 from core.services.file_selection import select_files
 from core.writers.itunes_writer import write_itunes_metadata
+from core.writers.mp4tags_batch import Mp4tagsBatcher
 from core.services.logging import log_serialized_metadata
 from core.services.run_artifacts import (
     RunDirs,
     append_run_log,
+    close_run_log,
     setup_run_dirs,
     write_log_summary,
     write_manifest_record,
 )
 from core.providers.tmdb.service import init_tmdb
-from core.services.write_pipeline import filter_existing_tags, has_sufficient_backup_space
+from core.services.write_pipeline import (
+    filter_existing_tags,
+    has_sufficient_backup_space,
+    invalidate_backup_space_cache,
+)
 from ffmpeg.backups import backup_metadata_path, backup_original_path, ffmpeg_backup_metadata, ffmpeg_restore_metadata
 import ffmpeg.inspect as inspect_module
 from ffmpeg.inspect import MediaInspector, resolve_ffprobe_path
@@ -39,7 +46,6 @@ from core.providers.tmdb.helpers import download_cover_art
 from core.providers.tmdb.client import (
     choose_preferred_match,
     tmdb_movie_details,
-    tmdb_search_best_match_with_candidates,
     tmdb_search_best_match_with_candidates_scored,
     tmdb_search_best_tv_match_with_candidates_scored,
     tmdb_tv_details,
@@ -83,6 +89,8 @@ class RunContext:
     tmdb_ctx: object
     movie_tagging_plan: Dict[str, object] | None
     tv_tagging_plan: Dict[str, object] | None
+    mp4tags_batcher: Mp4tagsBatcher | None = None
+    search_pool: ThreadPoolExecutor | None = None
 
 
 @dataclass
@@ -197,6 +205,12 @@ def prepare_run_context(options: RunOptions, cfg: Config) -> RunContext | None:
     inspector = MediaInspector(ffprobe_path)
     movie_tagging_plan = load_movie_plan()
     tv_tagging_plan = load_tv_plan()
+    mp4tags_batcher = None
+    if write_enabled and not dry_run and not test_mode and metadata_tool == "mp4tags":
+        mp4tags_batcher = Mp4tagsBatcher()
+    search_pool = None
+    if cfg.tmdb.allow_tv_fallback:
+        search_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tmdb-search")
 
     return RunContext(
         cfg=cfg,
@@ -229,6 +243,8 @@ def prepare_run_context(options: RunOptions, cfg: Config) -> RunContext | None:
         tmdb_ctx=tmdb_ctx,
         movie_tagging_plan=movie_tagging_plan,
         tv_tagging_plan=tv_tagging_plan,
+        mp4tags_batcher=mp4tags_batcher,
+        search_pool=search_pool,
     )
 
 
@@ -265,7 +281,7 @@ def process_one_file(
     try:
         stat = path.stat()
     except FileNotFoundError:
-        log.info(f"\n[{idx}/{total}] {path}")
+        log.info("\n[%d/%d] %s", idx, total, path)
         log.info("  ❌ File missing (skipping).")
         if run_dirs.run_manifest_path:
             write_manifest_record(
@@ -289,7 +305,7 @@ def process_one_file(
         year_guess = None
 
     if is_extras_title(title_guess):
-        log.info(f"\n[{idx}/{total}] {path}")
+        log.info("\n[%d/%d] %s", idx, total, path)
         log.info("  ⚠️ Extras/bonus content detected; writing title only and removing artwork.")
         tags_to_write: Dict[str, str] = {}
         if title_guess:
@@ -326,6 +342,8 @@ def process_one_file(
             )
             if backup_path:
                 log.info(f"  Backup: metadata saved to {backup_path}")
+            else:
+                invalidate_backup_space_cache()
 
         log.info("  ⚠️ ffmpeg writer cannot remove existing artwork; continuing with title update.")
         wrote = ffmpeg_write_metadata(
@@ -351,6 +369,7 @@ def process_one_file(
             status = "ok"
             reason = "extras_updated"
         else:
+            invalidate_backup_space_cache()
             log.info("  ❌ Failed to update extras metadata")
             status = "failed"
             reason = "extras_failed"
@@ -370,7 +389,7 @@ def process_one_file(
             )
         return ProcessResult(status=status)
 
-    log.info(f"\n[{idx}/{total}] {path}")
+    log.info("\n[%d/%d] %s", idx, total, path)
     if options.restore_backup:
         log.info("  Restore: using backup metadata")
     else:
@@ -435,75 +454,41 @@ def process_one_file(
                 log.info(f"  ⚠️ Could not inspect DRM status: {exc}")
 
         candidates = build_search_candidates(title_guess)
+        search_kwargs = dict(
+            session=ctx.tmdb_ctx.session,
+            api_key=ctx.tmdb_ctx.api_key,
+            titles=candidates,
+            year=year_guess,
+            language=ctx.tmdb_ctx.language,
+            include_adult=ctx.tmdb_ctx.include_adult,
+            min_score=ctx.tmdb_ctx.min_score,
+            fallback_min_score=ctx.cfg.tmdb.fallback_min_score,
+            fallback_min_votes=ctx.cfg.tmdb.fallback_min_votes,
+        )
         forced_media = str(options.media_type or "").lower().strip() or None
-        if forced_media == "movie":
-            movie_candidate = tmdb_search_best_match_with_candidates_scored(
-                session=ctx.tmdb_ctx.session,
-                api_key=ctx.tmdb_ctx.api_key,
-                titles=candidates,
-                year=year_guess,
-                language=ctx.tmdb_ctx.language,
-                include_adult=ctx.tmdb_ctx.include_adult,
-                min_score=ctx.tmdb_ctx.min_score,
-                fallback_min_score=ctx.cfg.tmdb.fallback_min_score,
-                fallback_min_votes=ctx.cfg.tmdb.fallback_min_votes,
-            )
-            best = movie_candidate.result if movie_candidate else None
-            media_type = "movie"
-        elif forced_media == "tv":
-            tv_candidate = tmdb_search_best_tv_match_with_candidates_scored(
-                session=ctx.tmdb_ctx.session,
-                api_key=ctx.tmdb_ctx.api_key,
-                titles=candidates,
-                year=year_guess,
-                language=ctx.tmdb_ctx.language,
-                include_adult=ctx.tmdb_ctx.include_adult,
-                min_score=ctx.tmdb_ctx.min_score,
-                fallback_min_score=ctx.cfg.tmdb.fallback_min_score,
-                fallback_min_votes=ctx.cfg.tmdb.fallback_min_votes,
-            )
+        searches = 1
+        if forced_media == "tv":
+            tv_candidate = tmdb_search_best_tv_match_with_candidates_scored(**search_kwargs)
             best = tv_candidate.result if tv_candidate else None
             media_type = "tv"
-        elif ctx.cfg.tmdb.allow_tv_fallback:
-            movie_candidate = tmdb_search_best_match_with_candidates_scored(
-                session=ctx.tmdb_ctx.session,
-                api_key=ctx.tmdb_ctx.api_key,
-                titles=candidates,
-                year=year_guess,
-                language=ctx.tmdb_ctx.language,
-                include_adult=ctx.tmdb_ctx.include_adult,
-                min_score=ctx.tmdb_ctx.min_score,
-                fallback_min_score=ctx.cfg.tmdb.fallback_min_score,
-                fallback_min_votes=ctx.cfg.tmdb.fallback_min_votes,
-            )
-            tv_candidate = tmdb_search_best_tv_match_with_candidates_scored(
-                session=ctx.tmdb_ctx.session,
-                api_key=ctx.tmdb_ctx.api_key,
-                titles=candidates,
-                year=year_guess,
-                language=ctx.tmdb_ctx.language,
-                include_adult=ctx.tmdb_ctx.include_adult,
-                min_score=ctx.tmdb_ctx.min_score,
-                fallback_min_score=ctx.cfg.tmdb.fallback_min_score,
-                fallback_min_votes=ctx.cfg.tmdb.fallback_min_votes,
-            )
+        elif forced_media != "movie" and ctx.search_pool is not None:
+            # Both searches always run and are network-bound, so the movie
+            # search goes to the run's worker thread while the TV search runs
+            # here.
+            movie_future = ctx.search_pool.submit(tmdb_search_best_match_with_candidates_scored, **search_kwargs)
+            tv_candidate = tmdb_search_best_tv_match_with_candidates_scored(**search_kwargs)
+            movie_candidate = movie_future.result()
+            searches = 2
             chosen = choose_preferred_match(movie_candidate, tv_candidate)
             best = chosen.result if chosen else None
             media_type = chosen.media_type if chosen else "movie"
         else:
-            best = tmdb_search_best_match_with_candidates(
-                session=ctx.tmdb_ctx.session,
-                api_key=ctx.tmdb_ctx.api_key,
-                titles=candidates,
-                year=year_guess,
-                language=ctx.tmdb_ctx.language,
-                include_adult=ctx.tmdb_ctx.include_adult,
-                min_score=ctx.tmdb_ctx.min_score,
-                fallback_min_score=ctx.cfg.tmdb.fallback_min_score,
-                fallback_min_votes=ctx.cfg.tmdb.fallback_min_votes,
-            )
+            movie_candidate = tmdb_search_best_match_with_candidates_scored(**search_kwargs)
+            best = movie_candidate.result if movie_candidate else None
             media_type = "movie"
-        time.sleep(ctx.tmdb_ctx.delay)
+        # Pace per search so overlapping the two searches does not raise the
+        # average request rate.
+        time.sleep(ctx.tmdb_ctx.delay * searches)
 
         if not best:
             log.info("  TMDb: no confident match found (skipping).")
@@ -654,10 +639,10 @@ def process_one_file(
             except Exception as exc:
                 log.info(f"  ⚠️ Could not read existing tags: {exc}")
             if existing_tags:
-                tags_to_write, skipped = filter_existing_tags(tags_to_write, existing_tags)
+                tags_to_write, skipped, is_noop = filter_existing_tags(tags_to_write, existing_tags)
                 if skipped:
                     log.info(f"  Skipping existing tags: {', '.join(skipped)}")
-                if not tags_to_write and not itunes_tags:
+                if is_noop and not itunes_tags:
                     log.info("  All configured tags already exist (skipping write).")
                     log_skip("existing_tags")
                     if run_dirs.run_manifest_path:
@@ -762,6 +747,8 @@ def process_one_file(
                 )
                 if backup_path:
                     log.info(f"  Backup: metadata saved to {backup_path}")
+                else:
+                    invalidate_backup_space_cache()
             wrote = True
             if tags_to_write or cover_art_path:
                 wrote = ffmpeg_write_metadata(
@@ -781,18 +768,66 @@ def process_one_file(
                     dry_run=ctx.dry_run,
                     test_mode=ctx.test_mode,
                 )
-            if "director" in tags_to_write:
+                if not wrote:
+                    invalidate_backup_space_cache()
+            director = tags_to_write.get("director")
+            if director and not itunes_tags:
                 wrote = (
                     wrote
                     and write_standard_director(
                         input_path=path,
-                        director=tags_to_write.get("director"),
+                        director=director,
                         log_path=run_dirs.run_log_path,
                         dry_run=ctx.dry_run,
                         test_mode=ctx.test_mode,
                     )
                 )
 
+            def finish_write(wrote: bool) -> ProcessResult:
+                if not tags_to_write and not itunes_tags and not cover_art_path:
+                    wrote = False
+                if wrote:
+                    log.info("  ✅ Updated metadata")
+                    if (
+                        cover_art_path
+                        and ctx.cover_art_enabled
+                        and not ctx.test_mode
+                        and not ctx.dry_run
+                        and ctx.full_log
+                    ):
+                        try:
+                            has_artwork = inspect_module.has_attached_picture(
+                                ctx.ffprobe_path, path
+                            ) or inspect_module.has_artwork_tag(ctx.ffprobe_path, path)
+                            if not has_artwork:
+                                log.info("  ⚠️ Cover art not detected after write")
+                        except Exception as exc:
+                            log.info(f"  ⚠️ Could not verify artwork after write: {exc}")
+                    status = "ok"
+                    reason = "updated"
+                else:
+                    log.info("  ❌ Failed to update metadata")
+                    status = "failed"
+                    reason = "ffmpeg_failed"
+                if run_dirs.run_manifest_path:
+                    write_manifest_record(
+                        run_dirs.run_manifest_path,
+                        {
+                            "path": str(path),
+                            "status": status,
+                            "reason": reason,
+                            "tmdb_id": metadata.tmdb_id,
+                            "title": metadata.title,
+                            "mtime": stat.st_mtime if stat else None,
+                            "size": stat.st_size if stat else None,
+                        },
+                    )
+                return ProcessResult(status=status)
+
+            def finish_batched_write(wrote: bool) -> ProcessResult:
+                log.info("\n[mp4tags] %s", path)
+                return finish_write(wrote)
+
             if itunes_tags:
                 clear_itunes = bool(ctx.override_existing and not tags_to_write)
                 if ctx.metadata_tool != "mp4tags":
@@ -809,50 +844,15 @@ def process_one_file(
                         run_dir=run_dirs.run_backup_dir,
                         dry_run=ctx.dry_run,
                         test_mode=ctx.test_mode,
+                        director=director,
+                        mp4tags_batcher=ctx.mp4tags_batcher,
+                        on_complete=finish_batched_write,
                     )
                 )
-            if not tags_to_write and not itunes_tags and not cover_art_path:
-                wrote = False
-            if not itunes_tags and ctx.metadata_tool == "mp4tags":
-                # No iTunes-only tags; nothing else to do.
-                pass
-            if wrote:
-                log.info("  ✅ Updated metadata")
-                if (
-                    cover_art_path
-                    and ctx.cover_art_enabled
-                    and not ctx.test_mode
-                    and not ctx.dry_run
-                    and ctx.full_log
-                ):
-                    try:
-                        has_artwork = inspect_module.has_attached_picture(ctx.ffprobe_path, path) or inspect_module.has_artwork_tag(
-                            ctx.ffprobe_path, path
-                        )
-                        if not has_artwork:
-                            log.info("  ⚠️ Cover art not detected after write")
-                    except Exception as exc:
-                        log.info(f"  ⚠️ Could not verify artwork after write: {exc}")
-                status = "ok"
-                reason = "updated"
-            else:
-                log.info("  ❌ Failed to update metadata")
-                status = "failed"
-                reason = "ffmpeg_failed"
-            if run_dirs.run_manifest_path:
-                write_manifest_record(
-                    run_dirs.run_manifest_path,
-                    {
-                        "path": str(path),
-                        "status": status,
-                        "reason": reason,
-                        "tmdb_id": metadata.tmdb_id,
-                        "title": metadata.title,
-                        "mtime": stat.st_mtime if stat else None,
-                        "size": stat.st_size if stat else None,
-                    },
-                )
-            return ProcessResult(status=status)
+                if wrote and ctx.mp4tags_batcher is not None and ctx.mp4tags_batcher.is_pending(path):
+                    log.info("  mp4tags write queued")
+                    return ProcessResult(status="pending")
+            return finish_write(wrote)
 
         if run_dirs.run_manifest_path:
             write_manifest_record(
@@ -933,33 +933,41 @@ def run_files(
     run_dirs: RunDirs,
 ) -> RunSummary:
     """Process the list of files, retrying busy files once."""
+    if ctx.write_enabled and not ctx.test_mode and not options.restore_backup:
+        ctx.inspector.prewarm(files)
     deferred: list[Path] = []
-    ok_count = 0
-    skip_count = 0
-    fail_count = 0
-
-    for idx, path in enumerate(files, 1):
-        result = process_one_file(path, idx, len(files), options, ctx, run_dirs, is_retry=False)
-        if result.status == "deferred":
-            deferred.append(path)
-        elif result.status == "ok":
-            ok_count += 1
-        elif result.status == "skipped":
-            skip_count += 1
-        else:
-            fail_count += 1
-
-    if deferred:
-        log.info(f"\nRetrying {len(deferred)} file(s) due to resource busy...")
-        for idx, path in enumerate(deferred, 1):
-            result = process_one_file(path, idx, len(deferred), options, ctx, run_dirs, is_retry=True)
-            if result.status == "ok":
-                ok_count += 1
-            elif result.status == "skipped":
-                skip_count += 1
-            else:
-                fail_count += 1
+    results: list[ProcessResult] = []
+    batcher = ctx.mp4tags_batcher
 
+    try:
+        for idx, path in enumerate(files, 1):
+            result = process_one_file(path, idx, len(files), options, ctx, run_dirs, is_retry=False)
+            if result.status == "deferred":
+                deferred.append(path)
+            elif result.status != "pending":
+                results.append(result)
+            if batcher is not None:
+                results.extend(batcher.collect_done())
+
+        if deferred:
+            log.info(f"\nRetrying {len(deferred)} file(s) due to resource busy...")
+            for idx, path in enumerate(deferred, 1):
+                result = process_one_file(path, idx, len(deferred), options, ctx, run_dirs, is_retry=True)
+                if result.status != "pending":
+                    results.append(result)
+                if batcher is not None:
+                    results.extend(batcher.collect_done())
+    finally:
+        # Queued mp4tags writes are finished and recorded even when the run
+        # is interrupted, so --rerun-failed can pick them up.
+        if batcher is not None:
+            results.extend(batcher.close())
+        if ctx.search_pool is not None:
+            ctx.search_pool.shutdown()
+
+    ok_count = sum(1 for result in results if result.status == "ok")
+    skip_count = sum(1 for result in results if result.status == "skipped")
+    fail_count = len(results) - ok_count - skip_count
     return RunSummary(ok_count=ok_count, skip_count=skip_count, fail_count=fail_count)
 
 
@@ -996,7 +1004,7 @@ def run(options: RunOptions, cfg: Config) -> int:
     if not files:
         return 0
 
-    log.info(f"Found {len(files)} file(s).")
+    log.info("Found %d file(s).", len(files))
     if not ctx.write_enabled:
         log.info("NOTE: write.enabled is false; will only fetch & print metadata.\n")
 
@@ -1016,4 +1024,5 @@ def run(options: RunOptions, cfg: Config) -> int:
     if ctx.test_mode:
         notes.append(f"test_mode={ctx.test_mode_setting} — no files were modified")
     write_log_summary(run_dirs.run_log_path, summary.ok_count, summary.skip_count, summary.fail_count, notes)
+    close_run_log(run_dirs.run_log_path)
     return finalize_run(summary, ctx)
@@ -33,5 +33,6 @@ def select_files(
         files = find_movie_files(root, exts, ignore_substrings, max_files)
 
     if only_exts:
-        files = [path for path in files if path.suffix.lower() in only_exts]
+        allowed = frozenset(only_exts)
+        files = [path for path in files if path.suffix.lower() in allowed]
     return files
@@ -3,26 +3,49 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
-from datetime import datetime
+import time
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict
 
 from ffmpeg.backups import create_run_backup_dir
+from log_append import append_text, close_log, reset_log
+
+try:
+    import orjson  # optional dependency for faster manifest encoding/decoding
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+def _manifest_line(record: Dict[str, object]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(record) + b"\n"
+    return (json.dumps(record) + "\n").encode("utf-8")
+
+
+def _parse_manifest_line(line: str | bytes) -> Dict[str, object]:
+    if orjson is not None:
+        return orjson.loads(line)
+    return json.loads(line)
 
 
 def cleanup_run_dirs(base_dir: Path, max_logs: int) -> None:
     """Delete old log directories beyond the retention limit."""
-    if max_logs <= 0 or not base_dir.exists():
+    if max_logs <= 0:
+        return
+    try:
+        with os.scandir(base_dir) as it:
+            dirs = [entry for entry in it if entry.is_dir(follow_symlinks=False)]
+    except FileNotFoundError:
         return
-    dirs = [entry for entry in base_dir.iterdir() if entry.is_dir()]
     dirs.sort(key=lambda entry: entry.name)
     excess = len(dirs) - max_logs
     if excess <= 0:
         return
     for entry in dirs[:excess]:
-        shutil.rmtree(entry, ignore_errors=True)
+        shutil.rmtree(entry.path, ignore_errors=True)
 
 
 @dataclass
@@ -47,66 +70,72 @@ def load_failed_from_manifest(path: Path) -> list[Path]:
         print(f"Run manifest not found: {path}")
         return []
     failed: list[Path] = []
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
-        try:
-            record = json.loads(line)
-        except json.JSONDecodeError:
-            continue
-        if record.get("status") != "failed":
-            continue
-        value = record.get("path")
-        if not value:
-            continue
-        failed.append(Path(value))
+    with path.open("rb") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                record = _parse_manifest_line(line)
+            except ValueError:
+                continue
+            if not isinstance(record, dict):
+                continue
+            if record.get("status") != "failed":
+                continue
+            value = record.get("path")
+            if not value:
+                continue
+            failed.append(Path(value))
     return failed
 
 
 def write_manifest_record(path: Path, record: Dict[str, object]) -> None:
     """Append a record to the run manifest."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("a", encoding="utf-8") as f:
-        f.write(json.dumps(record) + "\n")
+    with path.open("ab") as f:
+        f.write(_manifest_line(record))
+
+
+def close_run_log(log_path: Path | None) -> None:
+    """Close the cached handle for a run log, if one is open."""
+    close_log(log_path)
 
 
 def append_run_log(log_path: Path | None, message: str) -> None:
     """Append a line to the run log."""
     if not log_path:
         return
-    log_path.parent.mkdir(parents=True, exist_ok=True)
     lines = [line for line in message.splitlines() if line.strip()]
     if not lines:
         return
-    with log_path.open("a", encoding="utf-8") as f:
-        for line in lines:
-            f.write(f"- {line}\n")
+    append_text(log_path, "".join(f"- {line}\n" for line in lines))
 
 
 def write_log_header(log_path: Path, run_dir: Path) -> None:
     """Write a header for a new log file."""
-    started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("w", encoding="utf-8") as f:
-        f.write("Video Metadata Tagger Log\n")
-        f.write(f"Started: {started}\n")
-        f.write(f"Run Directory: {run_dir}\n")
-        f.write("\nSummary\n")
+    started = time.strftime("%Y-%m-%d %H:%M:%S")
+    reset_log(
+        log_path,
+        "Video Metadata Tagger Log\n"
+        f"Started: {started}\n"
+        f"Run Directory: {run_dir}\n"
+        "\nSummary\n",
+    )
 
 
 def write_log_summary(log_path: Path | None, ok: int, skipped: int, failed: int, notes: list[str]) -> None:
     """Append a summary section to the log."""
     if not log_path:
         return
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    with log_path.open("a", encoding="utf-8") as f:
-        f.write(f"Updated/Processed: {ok}\n")
-        f.write(f"Skipped:           {skipped}\n")
-        f.write(f"Failed:            {failed}\n")
-        if notes:
-            f.write("\nNotes\n")
-            for note in notes:
-                f.write(f"- {note}\n")
+    lines = [
+        f"Updated/Processed: {ok}\n",
+        f"Skipped:           {skipped}\n",
+        f"Failed:            {failed}\n",
+    ]
+    if notes:
+        lines.append("\nNotes\n")
+        lines.extend(f"- {note}\n" for note in notes)
+    append_text(log_path, "".join(lines))
 
 
 def setup_run_dirs(
@@ -2,22 +2,57 @@
 
 from __future__ import annotations
 
+import os
 import shutil
+import time
 from pathlib import Path
 from typing import Dict, List, Union
 
 
+_DISK_USAGE_TTL_SECONDS = 5.0
+_DISK_USAGE_CACHE: Dict[int, tuple[float, int]] = {}
+
+
 def has_sufficient_backup_space(path: Path, required_bytes: int) -> bool:
-    """Return True if there is enough free disk space for a backup."""
-    usage = shutil.disk_usage(path)
-    return usage.free >= required_bytes
+    """Return True if there is enough free disk space for a backup.
+
+    Free space is cached per filesystem device for a few seconds and reduced
+    by each approved backup so consecutive checks stay conservative without
+    re-querying the filesystem for every file.
+    """
+    device = os.stat(path).st_dev
+    now = time.monotonic()
+    cached = _DISK_USAGE_CACHE.get(device)
+    if cached and now - cached[0] < _DISK_USAGE_TTL_SECONDS:
+        checked_at, free = cached
+    else:
+        checked_at, free = now, shutil.disk_usage(path).free
+    if free < required_bytes:
+        _DISK_USAGE_CACHE.pop(device, None)
+        return False
+    _DISK_USAGE_CACHE[device] = (checked_at, free - required_bytes)
+    return True
+
+
+def invalidate_backup_space_cache() -> None:
+    """Forget cached free space so the next check queries the filesystem.
+
+    Failed writes and backups can leave partial files behind, which the
+    cached estimate does not account for.
+    """
+    _DISK_USAGE_CACHE.clear()
 
 
 def filter_existing_tags(
     tags_to_write: Dict[str, Union[str, List[str]]],
     existing_tags: Dict[str, str],
-) -> tuple[Dict[str, Union[str, List[str]]], list[str]]:
-    """Drop tags that already exist and return skipped keys."""
+) -> tuple[Dict[str, Union[str, List[str]]], list[str], bool]:
+    """Drop tags that already exist.
+
+    Returns:
+        The remaining tags, the skipped keys, and whether nothing is left to
+        write (so the caller can skip spawning a writer entirely).
+    """
     filtered: Dict[str, Union[str, List[str]]] = {}
     skipped: list[str] = []
     for key, value in tags_to_write.items():
@@ -26,4 +61,4 @@ def filter_existing_tags(
             skipped.append(key)
             continue
         filtered[key] = value
-    return filtered, skipped
+    return filtered, skipped, not filtered
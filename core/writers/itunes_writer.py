@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, List, Union
 
 from core.writers.mp4tags import mp4tags_write_metadata
-from core.writers.mutagen_itunmovi import write_itunmovi_atom
+from core.writers.mp4tags_batch import Mp4tagsBatcher
+from core.writers.mutagen_itunmovi import (
+    build_itunmovi_plist,
+    mutagen_write_batch,
+    write_itunmovi_plist_file,
+)
 from logger import get_logger
 
 log = get_logger()
@@ -23,24 +28,52 @@ def write_itunes_metadata(
     run_dir: Path | None,
     dry_run: bool,
     test_mode: bool,
+    director: str | List[str] | None = None,
+    mp4tags_batcher: Mp4tagsBatcher | None = None,
+    on_complete: Callable[[bool], Any] | None = None,
 ) -> bool:
-    """Write iTunes-specific metadata using mutagen + mp4tags."""
+    """Write iTunes-specific metadata using mutagen + mp4tags.
+
+    The iTunMOVI atom and the optional standard director atom are written
+    in a single mutagen pass before mp4tags runs. When a batcher is given,
+    the mp4tags step is queued on it and ``on_complete`` receives its result
+    when the batcher is flushed.
+
+    ``tags`` is passed to mp4tags as-is; an ``iTunMOVI`` entry is only kept
+    for logging and is skipped by the mp4tags flag table, so callers do not
+    need to strip it.
+    """
     wrote = True
+    itunmovi_bytes = None
     if itunmovi_payload:
-        wrote = (
-            wrote
-            and write_itunmovi_atom(
-                input_path=input_path,
-                payload=itunmovi_payload,
-                run_dir=run_dir,
-                log_path=log_path,
-                dry_run=dry_run,
-                test_mode=test_mode,
-            )
+        itunmovi_bytes = build_itunmovi_plist(itunmovi_payload)
+        write_itunmovi_plist_file(input_path, itunmovi_bytes, run_dir, log_path)
+    if itunmovi_bytes or director:
+        wrote = mutagen_write_batch(
+            input_path=input_path,
+            itunmovi_bytes=itunmovi_bytes,
+            director=director,
+            log_path=log_path,
+            dry_run=dry_run,
+            test_mode=test_mode,
+        )
+    if tags and wrote and mp4tags_batcher is not None and not dry_run and not test_mode:
+
+        def complete(ok: bool) -> Any:
+            if not ok:
+                log.info(f"  ⚠️ Failed writing iTunes-specific metadata for {input_path}")
+            return on_complete(ok) if on_complete else ok
+
+        mp4tags_batcher.submit(
+            mp4tags_path=mp4tags_path,
+            input_path=input_path,
+            tags=tags,
+            log_path=log_path,
+            clear_metadata=clear_metadata,
+            on_complete=complete,
         )
+        return True
     if tags:
-        tags = dict(tags)
-        tags.pop("iTunMOVI", None)
         wrote = (
             wrote
             and mp4tags_write_metadata(
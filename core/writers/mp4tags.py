@@ -4,8 +4,11 @@ from __future__ import annotations
 
 import subprocess
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Union
 
+from ffmpeg.backups import decode_stderr
+from log_append import make_appender
 from logger import get_logger
 
 log = get_logger()
@@ -20,7 +23,7 @@ _TAG_MAP = {
     "composer": "-w",
 }
 
-_SKIP_TAGS = {
+_SKIP_TAGS = frozenset({
     "genre",  # keep genres in ffmpeg for repeated atoms
     "keywords",
     "grouping",
@@ -32,81 +35,111 @@ _SKIP_TAGS = {
     "producers",
     "screenwriters",
     "iTunMOVI",
-}
+})
 
+# Single lookup per tag: skipped keys map to None, unknown keys are absent.
+_TAG_DISPATCH = MappingProxyType({**dict.fromkeys(_SKIP_TAGS), **_TAG_MAP})
 
-def mp4tags_write_metadata(
+
+def build_mp4tags_cmd(
     mp4tags_path: str,
     input_path: Path,
     tags: Dict[str, Union[str, List[str]]],
-    log_path: Path | None,
     clear_metadata: bool,
-    dry_run: bool,
-    test_mode: bool,
-) -> bool:
-    """Write metadata using mp4tags."""
-    if not tags:
-        return True
-
-    def append_log(message: str) -> None:
-        if not log_path:
-            return
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(message)
-
+    log_path: Path | None,
+) -> list[str]:
+    """Build the mp4tags command line for a file's tags."""
     cmd: list[str] = [mp4tags_path]
 
     for key, value in tags.items():
-        if value is None:
-            continue
-        if key in _SKIP_TAGS:
-            continue
-        flag = _TAG_MAP.get(key)
-        if not flag:
+        flag = _TAG_DISPATCH.get(key)
+        if flag is None or value is None:
             continue
-        values = value if isinstance(value, list) else [value]
+        values = value if isinstance(value, list) else (value,)
         for item in values:
-            if not str(item).strip():
+            text = str(item)
+            if not text.strip():
                 continue
             if key == "media_type":
-                normalized = str(item).strip().lower().replace(" ", "")
-                cmd += [flag, normalized]
-                continue
-            cmd += [flag, str(item)]
+                text = text.strip().lower().replace(" ", "")
+            cmd.extend((flag, text))
 
     if clear_metadata:
         log.info("mp4tags: clear_metadata requested (no direct clear flag; relying on ffmpeg pass)")
-        append_log(f"[mp4tags] {input_path}\nclear_metadata: requested\n")
+        make_appender(log_path)(f"[mp4tags] {input_path}\nclear_metadata: requested\n")
+
+    cmd.append(str(input_path))
+    return cmd
+
+
+def run_mp4tags(cmd: list[str]) -> tuple[int | None, str, Exception | None]:
+    """Run an mp4tags command without logging.
+
+    Safe to call from worker threads; pass the result to
+    ``report_mp4tags_result`` on the thread that owns the log output.
+
+    Returns:
+        ``(returncode, stderr, error)``; ``returncode`` is None when mp4tags
+        could not be started, with the exception in ``error``.
+    """
+    try:
+        proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    except Exception as exc:
+        return None, "", exc
+    stderr = decode_stderr(proc.stderr) if proc.returncode != 0 else ""
+    return proc.returncode, stderr, None
 
-    cmd += [str(input_path)]
+
+def report_mp4tags_result(
+    cmd: list[str],
+    input_path: Path,
+    result: tuple[int | None, str, Exception | None],
+    log_path: Path | None,
+) -> bool:
+    """Log the outcome of ``run_mp4tags`` and return whether it succeeded."""
+    returncode, stderr, error = result
+    if returncode == 0:
+        return True
+    append_log = make_appender(log_path)
+    if isinstance(error, FileNotFoundError):
+        log.info(f"Could not find mp4tags at: {cmd[0]}")
+        append_log(f"[mp4tags] {input_path}\nerror: mp4tags not found at {cmd[0]}\n")
+    elif error is not None:
+        log.info(f"Error writing metadata for {input_path}: {error}")
+        append_log(f"[mp4tags] {input_path}\nerror: {error}\n")
+    else:
+        log.info(f"mp4tags failed for: {input_path}")
+        log.info(stderr.strip()[:2000])
+        append_log(
+            f"[mp4tags] {input_path}\n"
+            f"cmd: {' '.join(cmd)}\n"
+            f"stderr:\n{stderr}\n"
+        )
+    return False
+
+
+def mp4tags_write_metadata(
+    mp4tags_path: str,
+    input_path: Path,
+    tags: Dict[str, Union[str, List[str]]],
+    log_path: Path | None,
+    clear_metadata: bool,
+    dry_run: bool,
+    test_mode: bool,
+) -> bool:
+    """Write metadata using mp4tags."""
+    if not tags:
+        return True
+
+    cmd = build_mp4tags_cmd(mp4tags_path, input_path, tags, clear_metadata, log_path)
 
     if test_mode:
-        log.info(f"TEST MODE mp4tags cmd: {' '.join(cmd)}")
+        if log.is_enabled_for("info"):
+            log.info("TEST MODE mp4tags cmd: %s", " ".join(cmd))
         return True
     if dry_run:
-        log.info(f"DRY RUN mp4tags cmd: {' '.join(cmd)}")
+        if log.is_enabled_for("info"):
+            log.info("DRY RUN mp4tags cmd: %s", " ".join(cmd))
         return True
 
-    try:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode != 0:
-            log.info(f"mp4tags failed for: {input_path}")
-            log.info(proc.stderr.strip()[:2000])
-            append_log(
-                f"[mp4tags] {input_path}\n"
-                f"cmd: {' '.join(cmd)}\n"
-                f"stderr:\n{proc.stderr}\n"
-            )
-            return False
-        return True
-    except FileNotFoundError:
-        log.info(f"Could not find mp4tags at: {mp4tags_path}")
-        append_log(f"[mp4tags] {input_path}\nerror: mp4tags not found at {mp4tags_path}\n")
-        return False
-    except Exception as exc:
-        log.info(f"Error writing metadata for {input_path}: {exc}")
-        append_log(f"[mp4tags] {input_path}\nerror: {exc}\n")
-        return False
-    finally:
-        pass
+    return report_mp4tags_result(cmd, input_path, run_mp4tags(cmd), log_path)
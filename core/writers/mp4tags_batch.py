@@ -0,0 +1,95 @@
+"""Concurrent mp4tags execution across files in a run."""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Union
+
+from core.writers.mp4tags import build_mp4tags_cmd, report_mp4tags_result, run_mp4tags
+
+
+@dataclass(frozen=True, slots=True)
+class _PendingWrite:
+    input_path: Path
+    cmd: list[str]
+    log_path: Path | None
+    future: Future
+    on_complete: Callable[[bool], Any]
+
+
+class Mp4tagsBatcher:
+    """Run mp4tags for independent files on a worker pool.
+
+    Worker threads only run the mp4tags process. Its result is logged and
+    each file's completion callback is invoked from the calling thread
+    during ``collect_done`` or ``flush``, so console output, run-log lines
+    and manifest writes stay single-threaded.
+    """
+
+    def __init__(self, max_workers: int | None = None) -> None:
+        self._max_workers = max_workers or min(8, os.cpu_count() or 1)
+        self._executor: ThreadPoolExecutor | None = None
+        self._pending: list[_PendingWrite] = []
+        self._pending_paths: set[Path] = set()
+
+    def submit(
+        self,
+        *,
+        mp4tags_path: str,
+        input_path: Path,
+        tags: Dict[str, Union[str, List[str]]],
+        log_path: Path | None,
+        clear_metadata: bool,
+        on_complete: Callable[[bool], Any],
+    ) -> None:
+        """Queue an mp4tags write for a file."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="mp4tags")
+        cmd = build_mp4tags_cmd(mp4tags_path, input_path, tags, clear_metadata, log_path)
+        future = self._executor.submit(run_mp4tags, cmd)
+        self._pending.append(_PendingWrite(input_path, cmd, log_path, future, on_complete))
+        self._pending_paths.add(input_path)
+
+    def is_pending(self, input_path: Path) -> bool:
+        """Return True if a write for the path is queued and not yet flushed."""
+        return input_path in self._pending_paths
+
+    def collect_done(self) -> list[Any]:
+        """Run completion callbacks for writes that have already finished.
+
+        Writes still in progress stay queued for a later call or ``flush``.
+        """
+        done: list[_PendingWrite] = []
+        remaining: list[_PendingWrite] = []
+        for entry in self._pending:
+            (done if entry.future.done() else remaining).append(entry)
+        if not done:
+            return []
+        self._pending = remaining
+        self._pending_paths = {entry.input_path for entry in remaining}
+        return self._complete(done)
+
+    def flush(self) -> list[Any]:
+        """Wait for queued writes and return the completion callback results."""
+        pending = self._pending
+        self._pending = []
+        self._pending_paths = set()
+        return self._complete(pending)
+
+    def _complete(self, entries: list[_PendingWrite]) -> list[Any]:
+        results: list[Any] = []
+        for entry in entries:
+            wrote = report_mp4tags_result(entry.cmd, entry.input_path, entry.future.result(), entry.log_path)
+            results.append(entry.on_complete(wrote))
+        return results
+
+    def close(self) -> list[Any]:
+        """Flush outstanding writes and stop the worker pool."""
+        results = self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        return results
@@ -8,55 +8,85 @@ from typing import Any
 
 from mutagen.mp4 import MP4, MP4FreeForm
 
+from log_append import make_appender
 from logger import get_logger
 
 log = get_logger()
 
 
-def write_itunmovi_atom(
+_ITUNMOVI_KEY = "----:com.apple.iTunes:iTunMOVI"
+_DIRECTOR_KEY = "\xa9dir"
+
+
+def build_itunmovi_plist(payload: dict[str, Any]) -> bytes:
+    """Serialize an iTunMOVI payload to plist XML bytes."""
+    return plistlib.dumps(payload, fmt=plistlib.FMT_XML, sort_keys=False)
+
+
+def write_itunmovi_plist_file(
     input_path: Path,
-    payload: dict[str, Any],
+    plist_bytes: bytes,
     run_dir: Path | None,
     log_path: Path | None,
+) -> Path | None:
+    """Write the iTunMOVI plist side-file into the run directory."""
+    if not run_dir:
+        return None
+    out_dir = run_dir / "itunmovi"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    plist_path = out_dir / f"{input_path.stem}.itunmovi.plist"
+    plist_path.write_bytes(plist_bytes)
+    log.info(f"iTunMOVI plist written to {plist_path}")
+    make_appender(log_path)(f"[itunmovi] {input_path}\nplist: {plist_path}\n")
+    return plist_path
+
+
+def _first_director(director: str | list[str] | None) -> str:
+    if not director:
+        return ""
+    if isinstance(director, list):
+        return next((str(item).strip() for item in director if str(item).strip()), "")
+    return str(director).strip()
+
+
+def mutagen_write_batch(
+    input_path: Path,
+    itunmovi_bytes: bytes | None,
+    director: str | list[str] | None,
+    log_path: Path | None,
     dry_run: bool,
     test_mode: bool,
 ) -> bool:
-    """Write iTunMOVI payload using mutagen."""
-    if not payload:
+    """Write the iTunMOVI and director atoms with a single mutagen open/save."""
+    director_value = _first_director(director)
+    if not itunmovi_bytes and not director_value:
         return True
 
-    def append_log(message: str) -> None:
-        if not log_path:
-            return
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(message)
-
-    plist_bytes = plistlib.dumps(payload, fmt=plistlib.FMT_XML, sort_keys=False)
-    if run_dir:
-        out_dir = run_dir / "itunmovi"
-        out_dir.mkdir(parents=True, exist_ok=True)
-        plist_path = out_dir / f"{input_path.stem}.itunmovi.plist"
-        plist_path.write_bytes(plist_bytes)
-        log.info(f"iTunMOVI plist written to {plist_path}")
-        append_log(f"[itunmovi] {input_path}\nplist: {plist_path}\n")
+    atoms = []
+    if itunmovi_bytes:
+        atoms.append("iTunMOVI")
+    if director_value:
+        atoms.append("director")
+    label = " + ".join(atoms)
 
     if test_mode:
-        log.info("TEST MODE would write iTunMOVI atom via mutagen")
+        log.info(f"TEST MODE would write {label} atom via mutagen")
         return True
     if dry_run:
-        log.info("DRY RUN would write iTunMOVI atom via mutagen")
+        log.info(f"DRY RUN would write {label} atom via mutagen")
         return True
 
     try:
         mp4 = MP4(str(input_path))
-        key = "----:com.apple.iTunes:iTunMOVI"
-        mp4.tags[key] = [MP4FreeForm(plist_bytes)]
+        if itunmovi_bytes:
+            mp4.tags[_ITUNMOVI_KEY] = [MP4FreeForm(itunmovi_bytes)]
+        if director_value:
+            mp4.tags[_DIRECTOR_KEY] = [director_value]
         mp4.save()
         return True
     except Exception as exc:
-        log.info(f"mutagen failed writing iTunMOVI for {input_path}: {exc}")
-        append_log(f"[itunmovi] {input_path}\nerror: {exc}\n")
+        log.info(f"mutagen failed writing {label} for {input_path}: {exc}")
+        make_appender(log_path)(f"[{label}] {input_path}\nerror: {exc}\n")
         return False
 
 
@@ -68,36 +98,11 @@ def write_standard_director(
     test_mode: bool,
 ) -> bool:
     """Write the standard MP4 director atom using mutagen."""
-    if not director:
-        return True
-
-    def append_log(message: str) -> None:
-        if not log_path:
-            return
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(message)
-
-    if isinstance(director, list):
-        value = next((item for item in director if str(item).strip()), "")
-    else:
-        value = str(director).strip()
-    if not value:
-        return True
-
-    if test_mode:
-        log.info("TEST MODE would write director atom via mutagen")
-        return True
-    if dry_run:
-        log.info("DRY RUN would write director atom via mutagen")
-        return True
-
-    try:
-        mp4 = MP4(str(input_path))
-        mp4.tags["\xa9dir"] = [value]
-        mp4.save()
-        return True
-    except Exception as exc:
-        log.info(f"mutagen failed writing director for {input_path}: {exc}")
-        append_log(f"[director] {input_path}\nerror: {exc}\n")
-        return False
+    return mutagen_write_batch(
+        input_path=input_path,
+        itunmovi_bytes=None,
+        director=director,
+        log_path=log_path,
+        dry_run=dry_run,
+        test_mode=test_mode,
+    )
@@ -7,9 +7,17 @@ import shutil
 import subprocess
 import tempfile
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 
+def decode_stderr(stderr: bytes | str | None) -> str:
+    """Decode captured ffmpeg stderr for error reporting."""
+    if isinstance(stderr, (bytes, bytearray)):
+        return stderr.decode("utf-8", errors="replace")
+    return str(stderr or "")
+
+
 def create_run_backup_dir(base_dir: Path, now: datetime | None = None) -> Path:
     """Create a timestamped run directory.
 
@@ -26,6 +34,19 @@ def create_run_backup_dir(base_dir: Path, now: datetime | None = None) -> Path:
     return run_dir
 
 
+@lru_cache(maxsize=4096)
+def _safe_relative_name(input_path: Path, root: Path | None) -> str:
+    """Flatten a file path relative to root into a single backup file name."""
+    if root:
+        try:
+            rel = input_path.relative_to(root)
+        except ValueError:
+            rel = input_path.name
+    else:
+        rel = input_path.name
+    return str(rel).replace(os.sep, "__")
+
+
 def backup_metadata_path(backup_dir: Path, input_path: Path, root: Path | None) -> Path:
     """Build a metadata backup path for a given file.
 
@@ -37,15 +58,7 @@ def backup_metadata_path(backup_dir: Path, input_path: Path, root: Path | None)
     Returns:
         Path for the .ffmeta snapshot.
     """
-    if root:
-        try:
-            rel = input_path.relative_to(root)
-        except ValueError:
-            rel = input_path.name
-    else:
-        rel = input_path.name
-    rel_str = str(rel)
-    safe = rel_str.replace(os.sep, "__")
+    safe = _safe_relative_name(input_path, root)
     return backup_dir / f"{safe}.ffmeta"
 
 
@@ -61,15 +74,7 @@ def backup_original_path(backup_dir: Path, input_path: Path, root: Path | None,
     Returns:
         Path for the backup file.
     """
-    if root:
-        try:
-            rel = input_path.relative_to(root)
-        except ValueError:
-            rel = input_path.name
-    else:
-        rel = input_path.name
-    rel_str = str(rel)
-    safe = rel_str.replace(os.sep, "__")
+    safe = _safe_relative_name(input_path, root)
     return backup_dir / f"{safe}{suffix}"
 
 
@@ -107,10 +112,10 @@ def ffmpeg_backup_metadata(
         return backup_path
 
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        proc = subprocess.run(cmd, capture_output=True, text=False)
         if proc.returncode != 0:
             print(f"ffmpeg metadata backup failed for: {input_path}")
-            print(proc.stderr.strip()[:2000])
+            print(decode_stderr(proc.stderr).strip()[:2000])
             return None
         return backup_path
     except FileNotFoundError:
@@ -175,10 +180,10 @@ def ffmpeg_restore_metadata(
         return True
 
     try:
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        proc = subprocess.run(cmd, capture_output=True, text=False)
         if proc.returncode != 0:
             print(f"ffmpeg restore failed for: {input_path}")
-            print(proc.stderr.strip()[:2000])
+            print(decode_stderr(proc.stderr).strip()[:2000])
             tmp_path.unlink(missing_ok=True)
             return False
         if atomic_replace:
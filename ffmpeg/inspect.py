@@ -3,11 +3,35 @@
 from __future__ import annotations
 
 import json
+import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict
+from typing import Any, Dict, Iterable
 
+try:
+    import orjson  # optional dependency for faster ffprobe JSON parsing
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
 
+try:
+    import av  # optional dependency for in-process probing (PyAV)
+except ImportError:  # pragma: no cover
+    av = None  # type: ignore
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+_DRM_CODECS = frozenset({"drmi", "drms"})
+
+# Only request the fields the helpers read; full stream dumps can carry large
+# side-data trees that would otherwise be serialized and parsed per file.
+_STREAM_ENTRIES = "stream=codec_type,codec_name,codec_tag_string,width,height:stream_disposition=attached_pic"
+_PROBE_ENTRIES = f"format_tags:{_STREAM_ENTRIES}"
+
+
+@lru_cache(maxsize=8)
 def resolve_ffprobe_path(ffmpeg_path: str) -> str:
     """Resolve an ffprobe path from an ffmpeg path."""
     ffmpeg_candidate = Path(ffmpeg_path)
@@ -16,51 +40,28 @@ def resolve_ffprobe_path(ffmpeg_path: str) -> str:
     return "ffprobe"
 
 
-def read_format_tags(ffprobe_path: str, input_path: Path) -> Dict[str, str]:
-    """Read format tags from a media file using ffprobe."""
-    cmd = [
-        ffprobe_path,
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_entries",
-        "format_tags",
-        str(input_path),
-    ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
+def _run_ffprobe(ffprobe_path: str, input_path: Path, *query: str) -> Dict[str, Any]:
+    """Run ffprobe with JSON output and return the parsed payload."""
+    cmd = [ffprobe_path, "-v", "quiet", "-print_format", "json", *query, str(input_path)]
+    proc = subprocess.run(cmd, capture_output=True, text=False)
     if proc.returncode != 0:
-        raise RuntimeError(proc.stderr.strip() or "ffprobe failed")
-    data = json.loads(proc.stdout or "{}")
+        stderr = proc.stderr or b""
+        if isinstance(stderr, bytes):
+            stderr = stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(stderr.strip() or "ffprobe failed")
+    return _loads(proc.stdout or b"{}")
+
+
+def _format_tags(data: Dict[str, Any]) -> Dict[str, str]:
     tags = data.get("format", {}).get("tags", {}) or {}
-    normalized: Dict[str, str] = {}
-    for key, value in tags.items():
-        normalized[str(key).lower()] = str(value)
-    return normalized
+    return {str(key).lower(): str(value) for key, value in tags.items()}
 
 
-def has_artwork_tag(ffprobe_path: str, input_path: Path) -> bool:
-    """Return True if format tags indicate embedded artwork."""
-    tags = read_format_tags(ffprobe_path, input_path)
+def _has_artwork(tags: Dict[str, str]) -> bool:
     return "covr" in tags or "artwork" in tags
 
 
-def has_attached_picture(ffprobe_path: str, input_path: Path) -> bool:
-    """Return True if the media file has an attached picture stream."""
-    cmd = [
-        ffprobe_path,
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_streams",
-        str(input_path),
-    ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if proc.returncode != 0:
-        raise RuntimeError(proc.stderr.strip() or "ffprobe failed")
-    data = json.loads(proc.stdout or "{}")
-    streams = data.get("streams", []) or []
+def _has_attached_pic(streams: list[dict]) -> bool:
     for stream in streams:
         disposition = stream.get("disposition", {}) or {}
         if disposition.get("attached_pic") == 1:
@@ -68,85 +69,139 @@ def has_attached_picture(ffprobe_path: str, input_path: Path) -> bool:
     return False
 
 
-def has_drm_stream(ffprobe_path: str, input_path: Path) -> bool:
-    """Return True if the media file appears to use DRM-protected codecs."""
-    cmd = [
-        ffprobe_path,
-        "-v",
-        "quiet",
-        "-print_format",
-        "json",
-        "-show_streams",
-        str(input_path),
-    ]
-    proc = subprocess.run(cmd, capture_output=True, text=True)
-    if proc.returncode != 0:
-        raise RuntimeError(proc.stderr.strip() or "ffprobe failed")
-    data = json.loads(proc.stdout or "{}")
-    streams = data.get("streams", []) or []
+def _has_drm(streams: list[dict]) -> bool:
     for stream in streams:
         codec_name = str(stream.get("codec_name") or "").lower()
         codec_tag = str(stream.get("codec_tag_string") or "").lower()
-        if codec_name in {"drmi", "drms"} or codec_tag in {"drmi", "drms"}:
+        if codec_name in _DRM_CODECS or codec_tag in _DRM_CODECS:
             return True
     return False
 
 
+def _probe_with_pyav(input_path: Path) -> tuple[Dict[str, str], list[dict]]:
+    """Read format tags and stream fields in-process with PyAV.
+
+    Streams are returned in the same shape as ffprobe JSON so the helpers
+    above work on either backend. Raises when this PyAV build cannot report
+    stream dispositions, so the caller falls back to ffprobe instead of
+    missing attached pictures.
+    """
+    disposition_flags = getattr(getattr(av, "stream", None), "Disposition", None)
+    if disposition_flags is None:
+        raise RuntimeError("PyAV does not expose stream dispositions")
+    attached_flag = int(disposition_flags.attached_pic)
+    with av.open(str(input_path)) as container:
+        tags = {str(key).lower(): str(value) for key, value in container.metadata.items()}
+        streams: list[dict] = []
+        for stream in container.streams:
+            codec = stream.codec_context
+            is_attached = bool(int(getattr(stream, "disposition", 0)) & attached_flag)
+            streams.append(
+                {
+                    "codec_type": stream.type,
+                    "codec_name": getattr(codec, "name", "") or "",
+                    "codec_tag_string": getattr(codec, "codec_tag", "") or "",
+                    "width": getattr(codec, "width", None),
+                    "height": getattr(codec, "height", None),
+                    "disposition": {"attached_pic": 1 if is_attached else 0},
+                }
+            )
+    return tags, streams
+
+
+def read_format_tags(ffprobe_path: str, input_path: Path) -> Dict[str, str]:
+    """Read format tags from a media file using ffprobe."""
+    return _format_tags(_run_ffprobe(ffprobe_path, input_path, "-show_entries", "format_tags"))
+
+
+def has_artwork_tag(ffprobe_path: str, input_path: Path) -> bool:
+    """Return True if format tags indicate embedded artwork."""
+    return _has_artwork(read_format_tags(ffprobe_path, input_path))
+
+
+def has_attached_picture(ffprobe_path: str, input_path: Path) -> bool:
+    """Return True if the media file has an attached picture stream."""
+    data = _run_ffprobe(ffprobe_path, input_path, "-show_entries", "stream_disposition=attached_pic")
+    return _has_attached_pic(data.get("streams", []) or [])
+
+
+def has_drm_stream(ffprobe_path: str, input_path: Path) -> bool:
+    """Return True if the media file appears to use DRM-protected codecs."""
+    data = _run_ffprobe(ffprobe_path, input_path, "-show_entries", "stream=codec_name,codec_tag_string")
+    return _has_drm(data.get("streams", []) or [])
+
+
 class MediaInspector:
-    """Cache-backed ffprobe inspector for a single run."""
+    """Cache-backed ffprobe inspector for a single run.
+
+    Format tags and the stream fields used here come from one ffprobe call,
+    so each file is probed at most once per run. When PyAV is installed the
+    probe runs in-process instead, falling back to ffprobe if PyAV fails.
+    """
 
     def __init__(self, ffprobe_path: str) -> None:
         self._ffprobe_path = ffprobe_path
         self._format_tags_cache: Dict[Path, Dict[str, str]] = {}
         self._streams_cache: Dict[Path, list[dict]] = {}
+        self._lock = threading.Lock()
+
+    def _load_probe(self, input_path: Path) -> None:
+        probed = None
+        if av is not None:
+            try:
+                probed = _probe_with_pyav(input_path)
+            except Exception:
+                probed = None
+        if probed is None:
+            data = _run_ffprobe(self._ffprobe_path, input_path, "-show_entries", _PROBE_ENTRIES)
+            probed = (_format_tags(data), data.get("streams", []) or [])
+        tags, streams = probed
+        with self._lock:
+            self._format_tags_cache[input_path] = tags
+            self._streams_cache[input_path] = streams
+
+    def prewarm(self, paths: Iterable[Path], workers: int | None = None) -> None:
+        """Probe paths concurrently so later lookups are served from cache.
+
+        Probe failures are ignored here; they surface again when the path is
+        looked up individually.
+        """
+        pending = [path for path in paths if path not in self._streams_cache]
+        if not pending:
+            return
+        workers = workers or min(16, (os.cpu_count() or 1) * 2)
+
+        def probe(path: Path) -> None:
+            try:
+                self._load_probe(path)
+            except Exception:
+                pass
+
+        if workers <= 1 or len(pending) == 1:
+            for path in pending:
+                probe(path)
+            return
+        with ThreadPoolExecutor(max_workers=min(workers, len(pending)), thread_name_prefix="ffprobe") as pool:
+            list(pool.map(probe, pending))
 
     def read_format_tags(self, input_path: Path) -> Dict[str, str]:
         if input_path not in self._format_tags_cache:
-            self._format_tags_cache[input_path] = read_format_tags(self._ffprobe_path, input_path)
+            self._load_probe(input_path)
         return self._format_tags_cache[input_path]
 
     def _load_streams(self, input_path: Path) -> list[dict]:
-        if input_path in self._streams_cache:
-            return self._streams_cache[input_path]
-        cmd = [
-            self._ffprobe_path,
-            "-v",
-            "quiet",
-            "-print_format",
-            "json",
-            "-show_streams",
-            str(input_path),
-        ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
-        if proc.returncode != 0:
-            raise RuntimeError(proc.stderr.strip() or "ffprobe failed")
-        data = json.loads(proc.stdout or "{}")
-        streams = data.get("streams", []) or []
-        self._streams_cache[input_path] = streams
-        return streams
+        if input_path not in self._streams_cache:
+            self._load_probe(input_path)
+        return self._streams_cache[input_path]
 
     def has_attached_picture(self, input_path: Path) -> bool:
-        streams = self._load_streams(input_path)
-        for stream in streams:
-            disposition = stream.get("disposition", {}) or {}
-            if disposition.get("attached_pic") == 1:
-                return True
-        return False
+        return _has_attached_pic(self._load_streams(input_path))
 
     def has_artwork_tag(self, input_path: Path) -> bool:
-        if input_path not in self._format_tags_cache:
-            self._format_tags_cache[input_path] = read_format_tags(self._ffprobe_path, input_path)
-        tags = self._format_tags_cache[input_path]
-        return "covr" in tags or "artwork" in tags
+        return _has_artwork(self.read_format_tags(input_path))
 
     def has_drm_stream(self, input_path: Path) -> bool:
-        streams = self._load_streams(input_path)
-        for stream in streams:
-            codec_name = str(stream.get("codec_name") or "").lower()
-            codec_tag = str(stream.get("codec_tag_string") or "").lower()
-            if codec_name in {"drmi", "drms"} or codec_tag in {"drmi", "drms"}:
-                return True
-        return False
+        return _has_drm(self._load_streams(input_path))
 
     def get_video_dimensions(self, input_path: Path) -> tuple[int | None, int | None]:
         """Return width/height for the first video stream, if available."""
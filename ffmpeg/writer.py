@@ -2,24 +2,152 @@
 
 from __future__ import annotations
 
+import ctypes
+import ctypes.util
 import os
+import re
 import shutil
 import subprocess
-import tempfile
+import sys
 import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Sequence, Union
+from typing import Callable, Dict, Iterator, List, Sequence, Union
 
+from ffmpeg.backups import decode_stderr
+from log_append import make_appender
 from logger import get_logger
 
 
 log = get_logger()
 
 
+_STDERR_TAIL_BYTES = 64 * 1024
+# ffmpeg errors that mean the cover art stream cannot be muxed; retry without it.
+_COVER_ART_RETRY_RE = re.compile(rb"codec mjpeg|attached pic", re.IGNORECASE)
+_FICLONE = 0x40049409  # Linux _IOW(0x94, 9, int)
+_COPY_CHUNK_BYTES = 64 * 1024 * 1024
+_AT_FDCWD = -100
+_RENAME_EXCHANGE = 2
+
+
 class ResourceBusyError(RuntimeError):
     """Raised when output replacement fails due to a busy file."""
 
 
+def _clonefile(src: Path, dst: Path) -> bool:
+    """Clone ``src`` to ``dst`` with macOS clonefile(2); return False if unsupported."""
+    libc_name = ctypes.util.find_library("c")
+    if not libc_name:
+        return False
+    libc = ctypes.CDLL(libc_name, use_errno=True)
+    clonefile = getattr(libc, "clonefile", None)
+    if clonefile is None:
+        return False
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def _reflink_or_copy(src: Path, dst: Path) -> None:
+    """Copy a file, preferring a copy-on-write clone when the filesystem allows it.
+
+    Tries FICLONE (Linux Btrfs/XFS), clonefile (macOS APFS), then an in-kernel
+    copy_file_range loop, and falls back to shutil.copy2. File metadata is
+    copied in every case.
+    """
+    if sys.platform == "darwin" and not dst.exists() and _clonefile(src, dst):
+        return
+    if sys.platform.startswith("linux"):
+        try:
+            import fcntl
+
+            with src.open("rb") as fsrc, dst.open("wb") as fdst:
+                try:
+                    fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                except OSError:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            fsrc.fileno(), fdst.fileno(), min(remaining, _COPY_CHUNK_BYTES)
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    if remaining > 0:
+                        raise OSError("copy_file_range stopped early")
+            shutil.copystat(src, dst)
+            return
+        except (OSError, AttributeError):
+            dst.unlink(missing_ok=True)
+    shutil.copy2(src, dst)
+
+
+@lru_cache(maxsize=1)
+def _renameat2() -> Callable[..., int] | None:
+    """Return libc's renameat2 on Linux, or None when it is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+    except OSError:
+        return None
+    func = getattr(libc, "renameat2", None)
+    if func is None:
+        return None
+    func.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_char_p, ctypes.c_uint]
+    func.restype = ctypes.c_int
+    return func
+
+
+def _exchange_into_place(src: Path, dest: Path) -> bool:
+    """Atomically swap ``src`` into ``dest`` with renameat2(RENAME_EXCHANGE).
+
+    The old ``dest`` contents end up at ``src`` and are removed. Returns False
+    when the syscall is unavailable or the filesystem rejects the exchange,
+    so the caller can fall back to a plain replace.
+    """
+    renameat2 = _renameat2()
+    if renameat2 is None:
+        return False
+    result = renameat2(_AT_FDCWD, os.fsencode(src), _AT_FDCWD, os.fsencode(dest), _RENAME_EXCHANGE)
+    if result != 0:
+        return False
+    try:
+        src.unlink()
+    except OSError:
+        pass
+    return True
+
+
+def _reserve_tmp_path(input_path: Path) -> Path:
+    """Create an empty, uniquely named .tagtmp file next to the input."""
+    prefix = f"{input_path.stem}.tagtmp."
+    for _ in range(100):
+        candidate = input_path.with_name(f"{prefix}{os.urandom(6).hex()}{input_path.suffix}")
+        try:
+            fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        return candidate
+    raise FileExistsError(f"No usable temporary name for {input_path}")
+
+
+def _run_ffmpeg(cmd: list[str]) -> tuple[int, bytes]:
+    """Run ffmpeg and return its exit code with the tail of its stderr.
+
+    stderr is drained in chunks and only the last ``_STDERR_TAIL_BYTES`` are
+    kept, so long remuxes do not hold their whole log in memory.
+    """
+    tail = bytearray()
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as proc:
+        for chunk in iter(lambda: proc.stderr.read(_STDERR_TAIL_BYTES), b""):
+            tail += chunk
+            if len(tail) > _STDERR_TAIL_BYTES:
+                del tail[: len(tail) - _STDERR_TAIL_BYTES]
+        returncode = proc.wait()
+    return returncode, bytes(tail)
+
+
 def ffmpeg_write_metadata(
     ffmpeg_path: str,
     input_path: Path,
@@ -63,18 +191,26 @@ def ffmpeg_write_metadata(
         return True
 
     def split_multi_value(value: str) -> list[str]:
-        return [part.strip() for part in value.split(",") if part.strip()]
+        return [part for part in (raw.strip() for raw in value.split(",")) if part]
 
-    def append_log(message: str) -> None:
-        if not log_path:
-            return
-        log_path.parent.mkdir(parents=True, exist_ok=True)
-        with log_path.open("a", encoding="utf-8") as f:
-            f.write(message)
+    append_log = make_appender(log_path)
 
     def cleanup_stale_tagtmp() -> None:
-        pattern = f"{input_path.stem}.tagtmp.*{input_path.suffix}"
-        for path in input_path.parent.glob(pattern):
+        prefix = f"{input_path.stem}.tagtmp."
+        suffix = input_path.suffix
+        min_length = len(prefix) + len(suffix)
+        try:
+            with os.scandir(input_path.parent) as entries:
+                stale = [
+                    Path(entry.path)
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(suffix)
+                    and len(entry.name) >= min_length
+                ]
+        except OSError:
+            return
+        for path in stale:
             try:
                 path.unlink()
                 log.info(f"Removed stale temp file: {path}")
@@ -82,61 +218,64 @@ def ffmpeg_write_metadata(
                 log.info(f"Failed to remove stale temp file: {path}: {exc}")
                 append_log(f"[ffmpeg] {input_path}\nerror: cleanup failed for {path}: {exc}\n")
 
+    def metadata_args() -> Iterator[str]:
+        for k, v in tags.items():
+            if v == "" or v is None:
+                continue
+            if isinstance(v, list):
+                values = [text for text in (str(item).strip() for item in v) if text]
+            else:
+                values = [str(v).strip()]
+            if k == "genre":
+                values = [genre for item in values for genre in split_multi_value(item)]
+            for item in values:
+                yield "-metadata"
+                yield f"{k}={item}"
+
+    # The argument groups are built once; the cover-art retry reuses them.
+    input_args = [ffmpeg_path, "-hide_banner", "-loglevel", "error"]
+    if ffmpeg_analyzeduration is not None:
+        input_args += ["-analyzeduration", str(ffmpeg_analyzeduration)]
+    if ffmpeg_probe_size is not None:
+        input_args += ["-probesize", str(ffmpeg_probe_size)]
+    input_args += ["-y", "-i", str(input_path)]
+    map_args = ["-map", "0:v:0", "-map", "0:a", "-map", "0:s?"]
+    if clear_metadata:
+        map_args += ["-map_metadata", "-1", "-map_chapters", "-1"]
+    if clear_tags:
+        for key in clear_tags:
+            map_args += ["-metadata", f"{key}="]
+    output_args = ["-c", "copy", *metadata_args()]
+
     def build_cmd(cover_path: Path | None) -> list[str]:
-        cmd = [ffmpeg_path]
-        if ffmpeg_analyzeduration is not None:
-            cmd += ["-analyzeduration", str(ffmpeg_analyzeduration)]
-        if ffmpeg_probe_size is not None:
-            cmd += ["-probesize", str(ffmpeg_probe_size)]
-        cmd += ["-y", "-i", str(input_path)]
-        if cover_path:
-            cmd += ["-i", str(cover_path)]
-        cmd += ["-map", "0:v:0", "-map", "0:a", "-map", "0:s?"]
-        if clear_metadata:
-            cmd += ["-map_metadata", "-1", "-map_chapters", "-1"]
-        if clear_tags:
-            for key in clear_tags:
-                cmd += ["-metadata", f"{key}="]
-        if cover_path:
-            cmd += [
-                "-map",
-                "1",
-                "-disposition:v:1",
-                "attached_pic",
-                "-metadata:s:v:1",
-                "title=cover",
-                "-metadata:s:v:1",
-                "comment=Cover",
-            ]
-        cmd += ["-c", "copy"]
-        return cmd
+        if not cover_path:
+            return [*input_args, *map_args, *output_args]
+        return [
+            *input_args,
+            "-i",
+            str(cover_path),
+            *map_args,
+            "-map",
+            "1",
+            "-disposition:v:1",
+            "attached_pic",
+            "-metadata:s:v:1",
+            "title=cover",
+            "-metadata:s:v:1",
+            "comment=Cover",
+            *output_args,
+        ]
 
     cmd = build_cmd(cover_art_path)
     if clear_tags:
         log.info(f"Clearing metadata fields: {', '.join(clear_tags)}")
         append_log(f"[ffmpeg] {input_path}\nclear_tags: {', '.join(clear_tags)}\n")
 
-    for k, v in tags.items():
-        if v == "" or v is None:
-            continue
-        values: list[str]
-        if isinstance(v, list):
-            values = [str(item).strip() for item in v if str(item).strip()]
-        else:
-            values = [str(v).strip()]
-        if not values:
-            continue
-        for item in values:
-            if k == "genre":
-                for genre in split_multi_value(item):
-                    cmd += ["-metadata", f"{k}={genre}"]
-                continue
-            cmd += ["-metadata", f"{k}={item}"]
-
     if test_mode:
         tmp_path = input_path.with_name(f"{input_path.stem}.tagtmp{input_path.suffix}")
         cmd += [str(tmp_path)]
-        log.info(f"TEST MODE ffmpeg cmd: {' '.join(cmd)}")
+        if log.is_enabled_for("info"):
+            log.info("TEST MODE ffmpeg cmd: %s", " ".join(cmd))
         if clear_metadata:
             log.info("TEST MODE would clear existing metadata")
         if backup_original and backup_path:
@@ -148,34 +287,23 @@ def ffmpeg_write_metadata(
         return True
 
     cleanup_stale_tagtmp()
-    tmp_dir = str(input_path.parent)
-    fd, tmp_name = tempfile.mkstemp(prefix=input_path.stem + ".tagtmp.", suffix=input_path.suffix, dir=tmp_dir)
-    os.close(fd)
-    tmp_path = Path(tmp_name)
+    tmp_path = _reserve_tmp_path(input_path)
 
     cmd += [str(tmp_path)]
 
     if dry_run:
-        log.info(f"DRY RUN ffmpeg cmd: {' '.join(cmd)}")
+        if log.is_enabled_for("info"):
+            log.info("DRY RUN ffmpeg cmd: %s", " ".join(cmd))
         try:
             tmp_path.unlink(missing_ok=True)
         except Exception:
             pass
         return True
 
-    def should_retry_without_cover_art(stderr: str) -> bool:
-        lowered = stderr.lower()
-        return "codec mjpeg" in lowered or "attached pic" in lowered
-
-    def decode_stderr(proc: subprocess.CompletedProcess[bytes]) -> str:
-        if isinstance(proc.stderr, (bytes, bytearray)):
-            return proc.stderr.decode("utf-8", errors="replace")
-        return str(proc.stderr or "")
-
     try:
-        proc = subprocess.run(cmd, capture_output=True)
-        stderr_text = decode_stderr(proc)
-        if proc.returncode != 0:
+        returncode, stderr_tail = _run_ffmpeg(cmd)
+        if returncode != 0:
+            stderr_text = decode_stderr(stderr_tail)
             log.info(f"ffmpeg failed for: {input_path}")
             log.info(stderr_text.strip()[:2000])
             append_log(
@@ -184,13 +312,13 @@ def ffmpeg_write_metadata(
                 f"stderr:\n{stderr_text}\n"
             )
             tmp_path.unlink(missing_ok=True)
-            if cover_art_path and should_retry_without_cover_art(stderr_text):
+            if cover_art_path and _COVER_ART_RETRY_RE.search(stderr_tail):
                 retry_cmd = build_cmd(None)
                 retry_cmd += [str(tmp_path)]
                 append_log(f"[ffmpeg] retry without cover art for {input_path}\n")
-                proc = subprocess.run(retry_cmd, capture_output=True)
-                stderr_text = decode_stderr(proc)
-                if proc.returncode != 0:
+                returncode, stderr_tail = _run_ffmpeg(retry_cmd)
+                if returncode != 0:
+                    stderr_text = decode_stderr(stderr_tail)
                     log.info(f"ffmpeg failed for: {input_path}")
                     log.info(stderr_text.strip()[:2000])
                     append_log(
@@ -204,7 +332,11 @@ def ffmpeg_write_metadata(
             else:
                 return False
 
-        if tmp_path.exists() and tmp_path.stat().st_size == 0:
+        try:
+            output_size: int | None = os.stat(tmp_path).st_size
+        except FileNotFoundError:
+            output_size = None
+        if output_size == 0:
             log.info(f"ffmpeg produced empty output for: {input_path}")
             append_log(f"[ffmpeg] {input_path}\nerror: output file is empty\n")
             tmp_path.unlink(missing_ok=True)
@@ -214,9 +346,11 @@ def ffmpeg_write_metadata(
             if backup_path.exists():
                 backup_path = backup_path.with_name(backup_path.name + backup_suffix)
             backup_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(input_path, backup_path)
+            _reflink_or_copy(input_path, backup_path)
 
         def replace_with_retries(src: Path, dest: Path, use_atomic: bool) -> bool:
+            if use_atomic and _exchange_into_place(src, dest):
+                return True
             for attempt in range(3):
                 try:
                     if use_atomic:
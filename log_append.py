@@ -0,0 +1,79 @@
+"""Shared append-only handles for run log files."""
+
+from __future__ import annotations
+
+import atexit
+import threading
+from pathlib import Path
+from typing import Callable, Dict, TextIO
+
+_HANDLES: Dict[Path, TextIO] = {}
+_LOCK = threading.Lock()
+
+
+def _noop(_message: str) -> None:
+    return None
+
+
+def _handle(log_path: Path) -> TextIO:
+    """Return a cached line-buffered append handle; caller holds the lock."""
+    handle = _HANDLES.get(log_path)
+    if handle is None or handle.closed:
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = log_path.open("a", encoding="utf-8", buffering=1)
+        _HANDLES[log_path] = handle
+    return handle
+
+
+def append_text(log_path: Path, text: str) -> None:
+    """Append raw text to a log file through its shared handle."""
+    with _LOCK:
+        _handle(log_path).write(text)
+
+
+def reset_log(log_path: Path, text: str) -> None:
+    """Truncate a log file and write ``text``, keeping the handle for appends."""
+    with _LOCK:
+        _close_unlocked(log_path)
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = log_path.open("w", encoding="utf-8", buffering=1)
+        handle.write(text)
+        _HANDLES[log_path] = handle
+
+
+def _close_unlocked(log_path: Path) -> None:
+    handle = _HANDLES.pop(log_path, None)
+    if handle is not None and not handle.closed:
+        handle.close()
+
+
+def close_log(log_path: Path | None) -> None:
+    """Close the shared handle for a log file, if one is open."""
+    if not log_path:
+        return
+    with _LOCK:
+        _close_unlocked(log_path)
+
+
+@atexit.register
+def close_all_logs() -> None:
+    """Close every shared log handle (registered to run at interpreter exit)."""
+    with _LOCK:
+        for log_path in list(_HANDLES):
+            _close_unlocked(log_path)
+
+
+def make_appender(log_path: Path | None) -> Callable[[str], None]:
+    """Return a function that appends messages to ``log_path``.
+
+    The log directory is created and the file opened once per path; every
+    appender for the same path shares that handle. A missing ``log_path``
+    yields a no-op appender.
+    """
+    if not log_path:
+        return _noop
+
+    def append_log(message: str) -> None:
+        append_text(log_path, message)
+
+    return append_log
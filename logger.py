@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import sys
-from typing import TextIO
+from typing import Any, TextIO
 
 
 _LEVELS = {"DEBUG": 10, "INFO": 20, "WARN": 30, "ERROR": 40}
+_DEBUG = _LEVELS["DEBUG"]
+_INFO = _LEVELS["INFO"]
+_WARN = _LEVELS["WARN"]
+_ERROR = _LEVELS["ERROR"]
 
 
 class Logger:
@@ -26,21 +30,28 @@ class Logger:
     def set_level(self, level: str) -> None:
         self._level = _LEVELS.get(level.upper(), _LEVELS["INFO"])
 
-    def debug(self, message: str) -> None:
-        if self._level <= _LEVELS["DEBUG"]:
-            self._write(message)
+    def is_enabled_for(self, level: str) -> bool:
+        """Return True if messages at ``level`` would be written."""
+        return self._level <= _LEVELS.get(level.upper(), _INFO)
 
-    def info(self, message: str) -> None:
-        if self._level <= _LEVELS["INFO"]:
-            self._write(message)
+    def _emit(self, message: str, args: tuple[Any, ...]) -> None:
+        self._write(message % args if args else message)
 
-    def warn(self, message: str) -> None:
-        if self._level <= _LEVELS["WARN"]:
-            self._write(message)
+    def debug(self, message: str, *args: Any) -> None:
+        if self._level <= _DEBUG:
+            self._emit(message, args)
 
-    def error(self, message: str) -> None:
-        if self._level <= _LEVELS["ERROR"]:
-            self._write(message)
+    def info(self, message: str, *args: Any) -> None:
+        if self._level <= _INFO:
+            self._emit(message, args)
+
+    def warn(self, message: str, *args: Any) -> None:
+        if self._level <= _WARN:
+            self._emit(message, args)
+
+    def error(self, message: str, *args: Any) -> None:
+        if self._level <= _ERROR:
+            self._emit(message, args)
 
 
 _LOGGER = Logger()
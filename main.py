@@ -3,12 +3,33 @@
 
 from __future__ import annotations
 
+import os
+import stat
+from pathlib import Path
+
 from cli import parse_cli
 from config import load_config
 from core.metadata_inspect import inspect as inspect_files
 from core.run import run
 
 
+def _classify(path: Path) -> str:
+    """Return "file", "dir", "other" or "missing" using a single stat call.
+
+    Any stat error (missing path, symlink loop, permission denied) counts as
+    missing, matching ``Path.is_file``/``Path.is_dir``.
+    """
+    try:
+        mode = os.stat(path).st_mode
+    except OSError:
+        return "missing"
+    if stat.S_ISREG(mode):
+        return "file"
+    if stat.S_ISDIR(mode):
+        return "dir"
+    return "other"
+
+
 def main() -> int:
     """Run the CLI entrypoint.
 
@@ -18,28 +39,26 @@ def main() -> int:
     print("\nTMDb Movie Tagger (config-driven)\n")
     command, options = parse_cli()
     if options.file:
-        if not options.file.exists() or not options.file.is_file():
+        if _classify(options.file) != "file":
             print(f"Not a file: {options.file}")
             return 2
-    elif command == "run" and not options.rerun_failed:
-        if not options.root or not options.root.exists() or not options.root.is_dir():
-            print(f"Not a directory: {options.root}")
-            return 2
-    elif command == "inspect":
-        if not options.root or not options.root.exists() or not options.root.is_dir():
+    elif command == "inspect" or (command == "run" and not options.rerun_failed):
+        if not options.root or _classify(options.root) != "dir":
             print(f"Not a directory: {options.root}")
             return 2
 
-    if options.config_path:
-        if not options.config_path.exists():
-            print(f"Config path not found: {options.config_path}")
+    config_path = options.config_path
+    if config_path is not None:
+        config_kind = _classify(config_path)
+        if config_kind == "missing":
+            print(f"Config path not found: {config_path}")
             return 2
-        if options.config_path.is_dir():
-            print(f"Config path must be a file: {options.config_path}")
+        if config_kind == "dir":
+            print(f"Config path must be a file: {config_path}")
             return 2
 
-    cfg = load_config(options.config_path)
-    if getattr(options, "override_existing", False):
+    cfg = load_config(config_path)
+    if options.override_existing:
         cfg.write.override_existing = True
     if command == "inspect":
         inspect_files(
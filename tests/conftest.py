@@ -0,0 +1,75 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+import pytest
+
+from core import run
+from core.providers.tmdb import adapter as tmdb_adapter
+from core.providers.tmdb import client as tmdb_client
+
+
+MOCK_MOVIE = {"id": 1, "title": "Top Gun", "release_date": "1986-05-16"}
+MOCK_TMDB_CONFIGURATION = {"images": {"secure_base_url": "https://image.tmdb.org/t/p/", "poster_sizes": ["w185"]}}
+MOCK_EMPTY_PAYLOAD: dict = {}
+
+_CLI_CONFIG = {
+    "tmdb": {"api_key_env": "TMDB_API_KEY", "language": "en-US", "include_adult": False, "min_score": 0.1},
+    "scan": {"extensions": [".m4v"], "ignore_substrings": [], "max_files": 0},
+    "matching": {"strip_tokens": [], "prefer_year_from_filename": True},
+    "write": {"enabled": False, "dry_run": False, "backup_original": True},
+}
+
+
+def _make_file(path: Path, data: bytes) -> Path:
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return path
+
+
+@pytest.fixture
+def make_file() -> Callable[[Path, bytes], Path]:
+    """Create a fixture file with raw bytes in one open/write/close."""
+    return _make_file
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch) -> None:
+    """Make TMDb request delays and retry backoffs instant in every test."""
+    monkeypatch.setattr(time, "sleep", lambda *_args, **_kwargs: None)
+
+
+@pytest.fixture
+def cli_config(tmp_path: Path) -> Callable[..., Path]:
+    """Write the shared CLI test config to ``tmp_path/config.json``.
+
+    Backups go to ``tmp_path/logs`` so runs never share a backup directory.
+    """
+
+    def write(extensions: Sequence[str] = (".m4v",)) -> Path:
+        cfg = {
+            **_CLI_CONFIG,
+            "scan": {**_CLI_CONFIG["scan"], "extensions": list(extensions)},
+            "write": {**_CLI_CONFIG["write"], "backup_dir": str(tmp_path / "logs")},
+        }
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(cfg), encoding="utf-8")
+        return path
+
+    return write
+
+
+@pytest.fixture
+def mock_tmdb(monkeypatch) -> None:
+    """Patch TMDb so every movie search matches ``MOCK_MOVIE`` without network access."""
+    match = tmdb_client.MatchCandidate(result={"id": 1}, score=9.0, votes=100, popularity=5.0, media_type="movie")
+    monkeypatch.setattr(run, "tmdb_search_best_match_with_candidates_scored", lambda **_kwargs: match)
+    monkeypatch.setattr(run, "tmdb_search_best_tv_match_with_candidates_scored", lambda **_kwargs: None)
+    monkeypatch.setattr(run, "tmdb_movie_details", lambda *_args, **_kwargs: MOCK_MOVIE)
+    monkeypatch.setattr(tmdb_client, "tmdb_configuration", lambda *_args, **_kwargs: MOCK_TMDB_CONFIGURATION)
+    monkeypatch.setattr(tmdb_adapter, "tmdb_request", lambda *_args, **_kwargs: MOCK_EMPTY_PAYLOAD)
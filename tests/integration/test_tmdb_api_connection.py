@@ -1,9 +1,7 @@
 import os
 
 import pytest
-import requests
-
-from core.providers.tmdb.client import tmdb_request
+from core.providers.tmdb.client import create_tmdb_session, tmdb_request
 
 
 @pytest.mark.integration
@@ -11,6 +9,6 @@ def test_tmdb_api_connection() -> None:
     api_key = os.environ.get("TMDB_API_KEY")
     if not api_key:
         pytest.skip("TMDB_API_KEY is not set in the environment.")
-    session = requests.Session()
+    session = create_tmdb_session()
     data = tmdb_request(session, api_key, "/configuration", {})
     assert "images" in data
@@ -0,0 +1,7 @@
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _tmdb_api_key(monkeypatch):
+    """Give each unit test a placeholder TMDb key, restored afterwards."""
+    monkeypatch.setenv("TMDB_API_KEY", "x")
@@ -1,15 +1,54 @@
-from collections import namedtuple
+from types import SimpleNamespace
 
 from core.services import write_pipeline
 
 
 def test_has_sufficient_backup_space(monkeypatch, tmp_path) -> None:
-    usage = namedtuple("usage", ["total", "used", "free"])
-
     def fake_disk_usage(_path):
-        return usage(total=100, used=90, free=10)
+        return SimpleNamespace(total=100, used=90, free=10)
 
     monkeypatch.setattr(write_pipeline.shutil, "disk_usage", fake_disk_usage)
+    monkeypatch.setattr(write_pipeline, "_DISK_USAGE_CACHE", {})
 
     assert write_pipeline.has_sufficient_backup_space(tmp_path, 5) is True
     assert write_pipeline.has_sufficient_backup_space(tmp_path, 20) is False
+
+
+def test_has_sufficient_backup_space_reuses_cached_usage(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def fake_disk_usage(path):
+        calls.append(path)
+        return SimpleNamespace(total=100, used=70, free=30)
+
+    monkeypatch.setattr(write_pipeline.shutil, "disk_usage", fake_disk_usage)
+    monkeypatch.setattr(write_pipeline, "_DISK_USAGE_CACHE", {})
+
+    assert write_pipeline.has_sufficient_backup_space(tmp_path, 10) is True
+    assert write_pipeline.has_sufficient_backup_space(tmp_path, 10) is True
+    assert write_pipeline.has_sufficient_backup_space(tmp_path, 20) is False
+    assert len(calls) == 1
+
+
+def test_backup_space_cache_is_shared_per_device_and_invalidated(monkeypatch, tmp_path) -> None:
+    calls = []
+
+    def fake_disk_usage(path):
+        calls.append(path)
+        return SimpleNamespace(total=100, used=70, free=30)
+
+    monkeypatch.setattr(write_pipeline.shutil, "disk_usage", fake_disk_usage)
+    monkeypatch.setattr(write_pipeline, "_DISK_USAGE_CACHE", {})
+    first = tmp_path / "run-1"
+    second = tmp_path / "run-2"
+    first.mkdir()
+    second.mkdir()
+
+    assert write_pipeline.has_sufficient_backup_space(first, 20) is True
+    assert write_pipeline.has_sufficient_backup_space(second, 20) is False
+    assert len(calls) == 1
+
+    write_pipeline.invalidate_backup_space_cache()
+
+    assert write_pipeline.has_sufficient_backup_space(second, 20) is True
+    assert len(calls) == 2
@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import cli
+
+
+def test_parse_cli_reuses_parser_without_leaking_state(tmp_path: Path) -> None:
+    movie = tmp_path / "movie.m4v"
+
+    _command, first = cli.parse_cli(["--file", str(movie), "--override-existing", "--test"])
+    _command, second = cli.parse_cli(["run", "--file", str(movie)])
+    command, inspect_options = cli.parse_cli(["inspect", "--file", str(movie)])
+
+    assert first.override_existing is True and first.test_mode == "basic"
+    assert second.override_existing is False and second.test_mode is None
+    assert command == "inspect"
+    assert inspect_options.file == movie.resolve()
+    assert inspect_options.override_existing is False
+
+
+def test_resolve_config_path_uses_cwd_default(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
+    args = cli._RUN_PARSER.parse_args([])
+
+    assert cli.resolve_config_path(args) is None
+
+    (tmp_path / "config.json").write_text("{}", encoding="utf-8")
+    assert cli.resolve_config_path(args) == (tmp_path / "config.json").resolve()
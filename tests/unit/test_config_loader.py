@@ -0,0 +1,55 @@
+import json
+import os
+from pathlib import Path
+
+from config import loader
+
+
+def test_load_config_reuses_parse_until_file_changes(tmp_path: Path, monkeypatch) -> None:
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text(json.dumps({"write": {"max_logs": 3}}), encoding="utf-8")
+    parsed = []
+    real_load_json = loader._load_json
+
+    def counting_load_json(path):
+        parsed.append(path)
+        return real_load_json(path)
+
+    monkeypatch.setattr(loader, "_load_json", counting_load_json)
+    loader._RAW_CONFIG_CACHE.clear()
+
+    first = loader.load_config(cfg_path)
+    first.write.override_existing = True
+    second = loader.load_config(cfg_path)
+    parsed_once = len(parsed)
+
+    cfg_path.write_text(json.dumps({"write": {"max_logs": 7}}), encoding="utf-8")
+    stat = cfg_path.stat()
+    os.utime(cfg_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    third = loader.load_config(cfg_path)
+
+    assert second is not first
+    assert second.write.override_existing is False
+    assert second.write.max_logs == 3
+    assert third.write.max_logs == 7
+    assert len(parsed) > parsed_once
+
+
+def test_load_config_snapshots_tmdb_api_key_from_env(tmp_path: Path, monkeypatch) -> None:
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text(json.dumps({"tmdb": {"api_key_env": "MY_TMDB_KEY"}}), encoding="utf-8")
+    monkeypatch.setenv("MY_TMDB_KEY", "from-env")
+
+    cfg = loader.load_config(cfg_path)
+    monkeypatch.delenv("MY_TMDB_KEY")
+
+    assert cfg.tmdb.api_key == "from-env"
+    assert loader.load_config(cfg_path).tmdb.api_key == ""
+
+
+def test_load_config_keeps_explicit_tmdb_api_key(tmp_path: Path, monkeypatch) -> None:
+    cfg_path = tmp_path / "config.json"
+    cfg_path.write_text(json.dumps({"tmdb": {"api_key": "from-config"}}), encoding="utf-8")
+    monkeypatch.setenv("TMDB_API_KEY", "from-env")
+
+    assert loader.load_config(cfg_path).tmdb.api_key == "from-config"
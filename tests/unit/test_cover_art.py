@@ -1,15 +1,27 @@
 import json
 import sys
+import tempfile
 from pathlib import Path
 from typing import Optional
 
+import requests
+
 import main
 from core import run
 from core.providers.tmdb import adapter as tmdb_adapter
 from core.mapping import transforms
+from core.providers.tmdb import helpers
 from core.providers.tmdb import client as tmdb_client
 
 
+_MOVIE_CANDIDATE = tmdb_client.MatchCandidate(
+    result={"id": 1}, score=9.0, votes=100, popularity=5.0, media_type="movie"
+)
+_TMDB_CONFIGURATION = {"images": {"secure_base_url": "https://image.tmdb.org/t/p/", "poster_sizes": ["w185"]}}
+_NO_KEYWORDS = {"keywords": []}
+_NO_CREW = {"crew": []}
+
+
 def _write_config(path: Path, backup_dir: Path, enabled: bool) -> None:
     cfg = {
         "tmdb": {"api_key_env": "TMDB_API_KEY", "language": "en-US", "include_adult": False, "min_score": 0.1},
@@ -32,59 +44,38 @@ def _write_config(path: Path, backup_dir: Path, enabled: bool) -> None:
 
 
 def _mock_tmdb(monkeypatch, poster_path: Optional[str]) -> None:
-    monkeypatch.setattr(
-        run,
-        "tmdb_search_best_match_with_candidates_scored",
-        lambda **kwargs: tmdb_client.MatchCandidate(
-            result={"id": 1}, score=9.0, votes=100, popularity=5.0, media_type="movie"
-        ),
-    )
+    monkeypatch.setattr(run, "tmdb_search_best_match_with_candidates_scored", lambda **kwargs: _MOVIE_CANDIDATE)
     monkeypatch.setattr(run, "tmdb_search_best_tv_match_with_candidates_scored", lambda **kwargs: None)
-    monkeypatch.setattr(
-        run,
-        "tmdb_movie_details",
-        lambda *args, **kwargs: {
-            "id": 1,
-            "title": "Top Gun",
-            "release_date": "1986-05-16",
-            "poster_path": poster_path,
-        },
-    )
-    monkeypatch.setattr(
-        tmdb_client,
-        "tmdb_configuration",
-        lambda *args, **kwargs: {
-            "images": {"secure_base_url": "https://image.tmdb.org/t/p/", "poster_sizes": ["w185"]}
-        },
-    )
+    details = {"id": 1, "title": "Top Gun", "release_date": "1986-05-16", "poster_path": poster_path}
+    images = {"posters": [{"file_path": poster_path}]} if poster_path else {"posters": []}
+    monkeypatch.setattr(run, "tmdb_movie_details", lambda *args, **kwargs: details)
+    monkeypatch.setattr(tmdb_client, "tmdb_configuration", lambda *args, **kwargs: _TMDB_CONFIGURATION)
     def fake_tmdb_request(session, api_key, endpoint, params):
         if endpoint.endswith("/images"):
-            return {"posters": [{"file_path": poster_path}]} if poster_path else {"posters": []}
+            return images
         if endpoint.endswith("/keywords"):
-            return {"keywords": []}
+            return _NO_KEYWORDS
         if endpoint.endswith("/credits"):
-            return {"crew": []}
+            return _NO_CREW
         return {}
     monkeypatch.setattr(tmdb_adapter, "tmdb_request", fake_tmdb_request)
-    monkeypatch.setattr(run.time, "sleep", lambda *_args, **_kwargs: None)
 
 
-def test_cover_art_downloads_and_attaches(tmp_path: Path, monkeypatch) -> None:
+def test_cover_art_downloads_and_attaches(tmp_path: Path, monkeypatch, make_file) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    make_file(movie, b"data")
     cfg_path = tmp_path / "config.json"
     _write_config(cfg_path, tmp_path / "logs", enabled=True)
     _mock_tmdb(monkeypatch, poster_path="/poster.jpg")
-    monkeypatch.setenv("TMDB_API_KEY", "x")
 
-    def fake_download(tmdb_path, out_path, config=None):
+    def fake_download(tmdb_path, out_path, config=None, session=None):
         out_path.write_bytes(b"img")
         return out_path
 
-    captured = {"cover": None}
+    covers: list[Optional[Path]] = []
 
     def fake_ffmpeg_write(**kwargs):
-        captured["cover"] = kwargs.get("cover_art_path")
+        covers.append(kwargs.get("cover_art_path"))
         return True
 
     monkeypatch.setattr(transforms, "download_tmdb_image_to_file", fake_download)
@@ -95,26 +86,27 @@ def test_cover_art_downloads_and_attaches(tmp_path: Path, monkeypatch) -> None:
     exit_code = main.main()
 
     assert exit_code == 0
-    assert captured["cover"] is not None
-    assert captured["cover"].exists()
+    assert len(covers) == 1
+    assert covers[0] is not None
+    assert covers[0].exists()
 
 
-def test_cover_art_skips_when_missing_poster(tmp_path: Path, monkeypatch) -> None:
+def test_cover_art_skips_when_missing_poster(tmp_path: Path, monkeypatch, make_file) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    make_file(movie, b"data")
     cfg_path = tmp_path / "config.json"
     _write_config(cfg_path, tmp_path / "logs", enabled=True)
     _mock_tmdb(monkeypatch, poster_path=None)
-    monkeypatch.setenv("TMDB_API_KEY", "x")
 
-    called = {"download": False, "cover": None}
+    downloads: list[Path] = []
+    covers: list[Optional[Path]] = []
 
-    def fake_download(tmdb_path, out_path, config=None):
-        called["download"] = True
+    def fake_download(tmdb_path, out_path, config=None, session=None):
+        downloads.append(out_path)
         return None
 
     def fake_ffmpeg_write(**kwargs):
-        called["cover"] = kwargs.get("cover_art_path")
+        covers.append(kwargs.get("cover_art_path"))
         return True
 
     monkeypatch.setattr(transforms, "download_tmdb_image_to_file", fake_download)
@@ -125,17 +117,16 @@ def test_cover_art_skips_when_missing_poster(tmp_path: Path, monkeypatch) -> Non
     exit_code = main.main()
 
     assert exit_code == 0
-    assert called["download"] is False
-    assert called["cover"] is None
+    assert downloads == []
+    assert covers == [None]
 
 
-def test_cover_art_logs_selected_image_in_verbose(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_cover_art_logs_selected_image_in_verbose(capsys, tmp_path: Path, monkeypatch, make_file) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    make_file(movie, b"data")
     cfg_path = tmp_path / "config.json"
     _write_config(cfg_path, tmp_path / "logs", enabled=True)
     _mock_tmdb(monkeypatch, poster_path="/poster.jpg")
-    monkeypatch.setenv("TMDB_API_KEY", "x")
     monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(cfg_path), "--file", str(movie), "--test", "verbose"])
 
     exit_code = main.main()
@@ -143,3 +134,58 @@ def test_cover_art_logs_selected_image_in_verbose(capsys, tmp_path: Path, monkey
     out = capsys.readouterr().out
     assert exit_code == 0
     assert "Cover art" not in out
+
+
+class _StreamedResponse:
+    def __init__(self, chunks: list[bytes], error: Exception | None = None) -> None:
+        self._chunks = chunks
+        self._error = error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        return None
+
+    def iter_content(self, chunk_size):
+        yield from self._chunks
+        if self._error is not None:
+            raise self._error
+
+
+def test_download_tmdb_image_reuses_session(tmp_path: Path) -> None:
+    calls: list[tuple[str, int, bool]] = []
+
+    class FakeSession:
+        def get(self, url, timeout, stream=False):
+            calls.append((url, timeout, stream))
+            return _StreamedResponse([b"im", b"g"])
+
+    config = transforms.TMDbImageDownloadConfig(base_url="https://image.tmdb.org/t/p/w185/")
+    out = transforms.download_tmdb_image_to_file("abc.jpg", tmp_path / "poster.jpg", config=config, session=FakeSession())
+
+    assert out.read_bytes() == b"img"
+    assert calls == [("https://image.tmdb.org/t/p/w185/abc.jpg", 30, True)]
+
+
+def test_download_cover_art_removes_partial_file_on_stream_error(monkeypatch, tmp_path: Path) -> None:
+    created: list[str] = []
+    real_mkstemp = tempfile.mkstemp
+
+    def fake_mkstemp(prefix, suffix):
+        fd, name = real_mkstemp(prefix=prefix, suffix=suffix, dir=tmp_path)
+        created.append(name)
+        return fd, name
+
+    class FakeSession:
+        def get(self, url, timeout, stream=False):
+            return _StreamedResponse([b"partial"], requests.ConnectionError("connection reset"))
+
+    monkeypatch.setattr(helpers.tempfile, "mkstemp", fake_mkstemp)
+
+    assert helpers.download_cover_art(FakeSession(), "https://image.tmdb.org/t/p/w185/abc.jpg", ".jpg") is None
+    assert len(created) == 1
+    assert not Path(created[0]).exists()
@@ -13,8 +13,118 @@ def test_has_drm_stream_detects_codec(monkeypatch) -> None:
     }
 
     def fake_run(_cmd, capture_output, text):
-        return SimpleNamespace(returncode=0, stdout=json.dumps(payload), stderr="")
+        assert text is False
+        return SimpleNamespace(returncode=0, stdout=json.dumps(payload).encode("utf-8"), stderr=b"")
 
     monkeypatch.setattr(inspect_module.subprocess, "run", fake_run)
 
     assert inspect_module.has_drm_stream("ffprobe", Path("movie.m4v")) is True
+
+
+def test_media_inspector_probes_each_file_once(monkeypatch) -> None:
+    payload = {
+        "format": {"tags": {"TITLE": "Top Gun", "covr": "1"}},
+        "streams": [{"codec_type": "video", "disposition": {"attached_pic": 1}}],
+    }
+    calls = []
+
+    def fake_run(cmd, capture_output, text):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=json.dumps(payload), stderr="")
+
+    monkeypatch.setattr(inspect_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(inspect_module, "av", None)
+    inspector = inspect_module.MediaInspector("ffprobe")
+    path = Path("movie.m4v")
+
+    assert inspector.read_format_tags(path) == {"title": "Top Gun", "covr": "1"}
+    assert inspector.has_attached_picture(path) is True
+    assert inspector.has_artwork_tag(path) is True
+    assert inspector.has_drm_stream(path) is False
+    assert len(calls) == 1
+    assert "-show_streams" not in calls[0]
+    assert calls[0][calls[0].index("-show_entries") + 1].startswith("format_tags:stream=")
+
+
+def test_media_inspector_prewarm_fills_cache(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(cmd, capture_output, text):
+        calls.append(cmd[-1])
+        if cmd[-1] == "broken.m4v":
+            return SimpleNamespace(returncode=1, stdout="", stderr="bad file")
+        return SimpleNamespace(returncode=0, stdout=json.dumps({"streams": []}), stderr="")
+
+    monkeypatch.setattr(inspect_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(inspect_module, "av", None)
+    inspector = inspect_module.MediaInspector("ffprobe")
+    paths = [Path(f"{idx}.m4v") for idx in range(4)] + [Path("broken.m4v")]
+
+    inspector.prewarm(paths, workers=3)
+
+    assert sorted(calls) == sorted(str(path) for path in paths)
+    assert inspector.has_drm_stream(Path("2.m4v")) is False
+    assert len(calls) == len(paths)
+
+
+def test_media_inspector_uses_pyav_when_available(monkeypatch) -> None:
+    class _Container:
+        metadata = {"TITLE": "Top Gun"}
+        streams = [
+            SimpleNamespace(
+                type="video",
+                codec_context=SimpleNamespace(name="h264", codec_tag="avc1", width=1920, height=1080),
+                disposition=0,
+            ),
+            SimpleNamespace(
+                type="video",
+                codec_context=SimpleNamespace(name="mjpeg", codec_tag="", width=600, height=900),
+                disposition=1024,
+            ),
+        ]
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *_exc):
+            return False
+
+    fake_av = SimpleNamespace(
+        open=lambda _path: _Container(),
+        stream=SimpleNamespace(Disposition=SimpleNamespace(attached_pic=1024)),
+    )
+
+    def fail_run(*_args, **_kwargs):
+        raise AssertionError("ffprobe should not run")
+
+    monkeypatch.setattr(inspect_module, "av", fake_av)
+    monkeypatch.setattr(inspect_module.subprocess, "run", fail_run)
+    inspector = inspect_module.MediaInspector("ffprobe")
+    path = Path("movie.m4v")
+
+    assert inspector.read_format_tags(path) == {"title": "Top Gun"}
+    assert inspector.has_attached_picture(path) is True
+    assert inspector.has_drm_stream(path) is False
+    assert inspector.get_video_dimensions(path) == (1920, 1080)
+
+
+def test_media_inspector_falls_back_without_pyav_disposition(monkeypatch) -> None:
+    payload = {
+        "format": {"tags": {"title": "Top Gun"}},
+        "streams": [{"codec_type": "video", "disposition": {"attached_pic": 1}}],
+    }
+    calls = []
+
+    def fail_open(_path):
+        raise AssertionError("PyAV should not open files without Disposition")
+
+    def fake_run(cmd, capture_output, text):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=json.dumps(payload), stderr="")
+
+    monkeypatch.setattr(inspect_module, "av", SimpleNamespace(open=fail_open, stream=SimpleNamespace()))
+    monkeypatch.setattr(inspect_module.subprocess, "run", fake_run)
+    inspector = inspect_module.MediaInspector("ffprobe")
+
+    assert inspector.has_attached_picture(Path("movie.m4v")) is True
+    assert len(calls) == 1
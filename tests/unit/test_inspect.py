@@ -20,7 +20,7 @@ def test_find_missing_tags() -> None:
 
 def test_inspect_writes_log(tmp_path: Path, monkeypatch) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    movie.write_bytes(b"data")
     log_path = tmp_path / "inspect.log"
     cfg = _build_config()
 
@@ -46,7 +46,7 @@ def test_inspect_writes_log(tmp_path: Path, monkeypatch) -> None:
 
 def test_inspect_reports_missing_artwork(tmp_path: Path, monkeypatch) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    movie.write_bytes(b"data")
     log_path = tmp_path / "inspect.log"
     cfg = config_from_dict(
         {
@@ -77,7 +77,7 @@ def test_inspect_reports_missing_artwork(tmp_path: Path, monkeypatch) -> None:
 
 def test_inspect_detects_covr_artwork(tmp_path: Path, monkeypatch) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    movie.write_bytes(b"data")
     log_path = tmp_path / "inspect.log"
     cfg = config_from_dict(
         {
@@ -108,7 +108,7 @@ def test_inspect_detects_covr_artwork(tmp_path: Path, monkeypatch) -> None:
 
 def test_inspect_accepts_rdns_tags(tmp_path: Path, monkeypatch) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
+    movie.write_bytes(b"data")
     log_path = tmp_path / "inspect.log"
     cfg = config_from_dict(
         {
@@ -142,7 +142,7 @@ def test_inspect_accepts_rdns_tags(tmp_path: Path, monkeypatch) -> None:
 
 def test_inspect_normalizes_itunes_year(tmp_path: Path, monkeypatch) -> None:
     movie = tmp_path / "300.mp4"
-    movie.write_text("data", encoding="utf-8")
+    movie.write_bytes(b"data")
     log_path = tmp_path / "inspect.log"
     cfg = config_from_dict(
         {
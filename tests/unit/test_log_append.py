@@ -0,0 +1,23 @@
+from pathlib import Path
+
+from core.services.run_artifacts import append_run_log, close_run_log, write_log_header
+from log_append import make_appender
+
+
+def test_make_appender_shares_run_log_handle(tmp_path: Path) -> None:
+    log_path = tmp_path / "run" / "run.log"
+    write_log_header(log_path, tmp_path / "run")
+    append_log = make_appender(log_path)
+
+    append_run_log(log_path, "first")
+    append_log("[mp4tags] movie.m4v\nerror: boom\n")
+    append_run_log(log_path, "second")
+    close_run_log(log_path)
+
+    assert log_path.read_text(encoding="utf-8").endswith(
+        "- first\n[mp4tags] movie.m4v\nerror: boom\n- second\n"
+    )
+
+
+def test_make_appender_without_path_is_noop() -> None:
+    make_appender(None)("ignored")
@@ -0,0 +1,16 @@
+import io
+
+from logger import Logger
+
+
+def test_logger_formats_args_only_when_enabled() -> None:
+    stream = io.StringIO()
+    logger = Logger(level="WARN", stream=stream)
+
+    logger.info("cmd: %s", "ffmpeg -i movie.m4v")
+    logger.warn("cmd: %s", "ffmpeg -i movie.m4v")
+    logger.warn("100% literal")
+
+    assert stream.getvalue() == "cmd: ffmpeg -i movie.m4v\n100% literal\n"
+    assert logger.is_enabled_for("error") is True
+    assert logger.is_enabled_for("info") is False
@@ -1,59 +1,22 @@
 import json
 import sys
 from pathlib import Path
+from types import SimpleNamespace
 
 import main
+from cli import RunOptions
+from config import config_from_dict
 from core import run
-from core.providers.tmdb import adapter as tmdb_adapter
 from core.providers.tmdb import client as tmdb_client
+from core.writers import itunes_writer, mp4tags_batch
+from ffmpeg.inspect import MediaInspector
 
 
-def _write_config(path: Path, backup_dir: Path, extensions=None) -> None:
-    cfg = {
-        "tmdb": {"api_key_env": "TMDB_API_KEY", "language": "en-US", "include_adult": False, "min_score": 0.1},
-        "scan": {"extensions": extensions or [".m4v"], "ignore_substrings": [], "max_files": 0},
-        "matching": {"strip_tokens": [], "prefer_year_from_filename": True},
-        "write": {
-            "enabled": False,
-            "dry_run": False,
-            "backup_original": True,
-            "backup_dir": str(backup_dir),
-        },
-    }
-    path.write_text(json.dumps(cfg), encoding="utf-8")
-
-
-def _mock_tmdb(monkeypatch) -> None:
-    monkeypatch.setattr(
-        run,
-        "tmdb_search_best_match_with_candidates_scored",
-        lambda **kwargs: tmdb_client.MatchCandidate(
-            result={"id": 1}, score=9.0, votes=100, popularity=5.0, media_type="movie"
-        ),
-    )
-    monkeypatch.setattr(run, "tmdb_search_best_tv_match_with_candidates_scored", lambda **kwargs: None)
-    monkeypatch.setattr(
-        run,
-        "tmdb_movie_details",
-        lambda *args, **kwargs: {"id": 1, "title": "Top Gun", "release_date": "1986-05-16"},
-    )
-    monkeypatch.setattr(
-        tmdb_client,
-        "tmdb_configuration",
-        lambda *args, **kwargs: {"images": {"secure_base_url": "https://image.tmdb.org/t/p/", "poster_sizes": ["w185"]}},
-    )
-    monkeypatch.setattr(tmdb_adapter, "tmdb_request", lambda *args, **kwargs: {})
-    monkeypatch.setattr(run.time, "sleep", lambda *_args, **_kwargs: None)
-
-
-def test_cli_root_processes_files(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_cli_root_processes_files(capsys, tmp_path: Path, monkeypatch, cli_config, mock_tmdb) -> None:
     root = tmp_path / "movies"
     root.mkdir()
-    (root / "Top Gun (1986).m4v").write_text("data", encoding="utf-8")
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs")
-    _mock_tmdb(monkeypatch)
-    monkeypatch.setenv("TMDB_API_KEY", "x")
+    (root / "Top Gun (1986).m4v").write_bytes(b"data")
+    cfg_path = cli_config()
     monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(cfg_path), "--root", str(root)])
 
     exit_code = main.main()
@@ -64,11 +27,10 @@ def test_cli_root_processes_files(capsys, tmp_path: Path, monkeypatch) -> None:
     assert "TMDb: matched 'Top Gun' (1986)" in out
 
 
-def test_cli_file_requires_configured_extension(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_cli_file_requires_configured_extension(capsys, tmp_path: Path, monkeypatch, cli_config) -> None:
     movie = tmp_path / "Top Gun (1986).mp4"
-    movie.write_text("data", encoding="utf-8")
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs", extensions=[".m4v"])
+    movie.write_bytes(b"data")
+    cfg_path = cli_config(extensions=[".m4v"])
     monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(cfg_path), "--file", str(movie)])
 
     exit_code = main.main()
@@ -78,9 +40,8 @@ def test_cli_file_requires_configured_extension(capsys, tmp_path: Path, monkeypa
     assert "File extension not configured" in out
 
 
-def test_cli_file_missing(capsys, tmp_path: Path, monkeypatch) -> None:
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs")
+def test_cli_file_missing(capsys, tmp_path: Path, monkeypatch, cli_config) -> None:
+    cfg_path = cli_config()
     missing = tmp_path / "missing.m4v"
     monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(cfg_path), "--file", str(missing)])
 
@@ -91,6 +52,15 @@ def test_cli_file_missing(capsys, tmp_path: Path, monkeypatch) -> None:
     assert "Not a file" in out
 
 
+def test_classify_treats_stat_errors_as_missing(tmp_path: Path, monkeypatch) -> None:
+    def denied(_path):
+        raise PermissionError("denied")
+
+    monkeypatch.setattr(main.os, "stat", denied)
+
+    assert main._classify(tmp_path / "movie.m4v") == "missing"
+
+
 def test_cli_config_missing(capsys, tmp_path: Path, monkeypatch) -> None:
     root = tmp_path / "movies"
     root.mkdir()
@@ -104,12 +74,26 @@ def test_cli_config_missing(capsys, tmp_path: Path, monkeypatch) -> None:
     assert "Config path not found" in out
 
 
-def test_cli_defaults_to_module_configs(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_cli_config_dir_and_root_file_rejected(capsys, tmp_path: Path, monkeypatch) -> None:
     root = tmp_path / "movies"
     root.mkdir()
-    (root / "Top Gun (1986).m4v").write_text("data", encoding="utf-8")
-    _mock_tmdb(monkeypatch)
-    monkeypatch.setenv("TMDB_API_KEY", "x")
+    monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(tmp_path), "--root", str(root)])
+
+    assert main.main() == 2
+    assert "Config path must be a file" in capsys.readouterr().out
+
+    not_a_dir = tmp_path / "movie.m4v"
+    not_a_dir.write_bytes(b"data")
+    monkeypatch.setattr(sys, "argv", ["main.py", "--root", str(not_a_dir)])
+
+    assert main.main() == 2
+    assert "Not a directory" in capsys.readouterr().out
+
+
+def test_cli_defaults_to_module_configs(capsys, tmp_path: Path, monkeypatch, mock_tmdb) -> None:
+    root = tmp_path / "movies"
+    root.mkdir()
+    (root / "Top Gun (1986).m4v").write_bytes(b"data")
     monkeypatch.setattr(sys, "argv", ["main.py", "--root", str(root), "--test"])
 
     exit_code = main.main()
@@ -119,11 +103,10 @@ def test_cli_defaults_to_module_configs(capsys, tmp_path: Path, monkeypatch) ->
     assert "Found 1 file(s)." in out
 
 
-def test_cli_restore_backup_uses_backup_dir(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_cli_restore_backup_uses_backup_dir(capsys, tmp_path: Path, monkeypatch, cli_config) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs")
+    movie.write_bytes(b"data")
+    cfg_path = cli_config()
     backup_dir = tmp_path / "logs" / "run"
     backup_dir.mkdir(parents=True)
     restored = {"called": False}
@@ -143,11 +126,38 @@ def test_cli_restore_backup_uses_backup_dir(capsys, tmp_path: Path, monkeypatch)
     assert "Restored metadata from backup" in out
 
 
-def test_cli_restore_backup_missing(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_run_files_skips_prewarm_when_restoring(tmp_path: Path, monkeypatch) -> None:
+    prewarmed: list = []
+    ctx = SimpleNamespace(
+        write_enabled=True,
+        test_mode=False,
+        mp4tags_batcher=None,
+        search_pool=None,
+        inspector=SimpleNamespace(prewarm=prewarmed.append),
+    )
+    options = RunOptions(
+        root=None,
+        file=tmp_path / "Top Gun (1986).m4v",
+        config_path=None,
+        restore_backup=tmp_path / "logs" / "run",
+        rerun_failed=None,
+        only_exts=[],
+        test_mode=None,
+        override_existing=False,
+        media_type=None,
+    )
+    monkeypatch.setattr(run, "process_one_file", lambda *_args, **_kwargs: run.ProcessResult(status="ok"))
+
+    summary = run.run_files([options.file], options, ctx, run_dirs=None)
+
+    assert prewarmed == []
+    assert summary.ok_count == 1
+
+
+def test_cli_restore_backup_missing(capsys, tmp_path: Path, monkeypatch, cli_config) -> None:
     movie = tmp_path / "Top Gun (1986).m4v"
-    movie.write_text("data", encoding="utf-8")
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs")
+    movie.write_bytes(b"data")
+    cfg_path = cli_config()
     missing_backup = tmp_path / "logs" / "missing"
     monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(cfg_path), "--file", str(movie), "--restore-backup", str(missing_backup)])
 
@@ -158,15 +168,12 @@ def test_cli_restore_backup_missing(capsys, tmp_path: Path, monkeypatch) -> None
     assert "Backup directory not found" in out
 
 
-def test_cli_only_ext_filters_files(capsys, tmp_path: Path, monkeypatch) -> None:
+def test_cli_only_ext_filters_files(capsys, tmp_path: Path, monkeypatch, cli_config, mock_tmdb) -> None:
     root = tmp_path / "movies"
     root.mkdir()
-    (root / "movie.m4v").write_text("data", encoding="utf-8")
-    (root / "movie.mp4").write_text("data", encoding="utf-8")
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs", extensions=[".m4v", ".mp4"])
-    _mock_tmdb(monkeypatch)
-    monkeypatch.setenv("TMDB_API_KEY", "x")
+    (root / "movie.m4v").write_bytes(b"data")
+    (root / "movie.mp4").write_bytes(b"data")
+    cfg_path = cli_config(extensions=[".m4v", ".mp4"])
     monkeypatch.setattr(
         sys,
         "argv",
@@ -180,20 +187,30 @@ def test_cli_only_ext_filters_files(capsys, tmp_path: Path, monkeypatch) -> None
     assert "Found 1 file(s)." in out
 
 
-def test_cli_falls_back_to_tv_search(capsys, tmp_path: Path, monkeypatch) -> None:
-    root = tmp_path / "movies"
-    root.mkdir()
-    (root / "Amelie.m4v").write_text("data", encoding="utf-8")
-    cfg_path = tmp_path / "config.json"
-    _write_config(cfg_path, tmp_path / "logs")
-    monkeypatch.setattr(run, "tmdb_search_best_match_with_candidates_scored", lambda **kwargs: None)
-    monkeypatch.setattr(
-        run,
-        "tmdb_search_best_tv_match_with_candidates_scored",
-        lambda **kwargs: tmdb_client.MatchCandidate(
-            result={"id": 2}, score=8.5, votes=200, popularity=7.0, media_type="tv"
-        ),
+def test_run_falls_back_to_tv_search(capsys, tmp_path: Path, monkeypatch) -> None:
+    movie = tmp_path / "Amelie.m4v"
+    movie.write_bytes(b"data")
+    cfg = config_from_dict(
+        {
+            "tmdb": {"api_key": "x", "min_score": 0.1},
+            "scan": {"extensions": [".m4v"]},
+            "write": {"enabled": False, "backup_dir": str(tmp_path / "logs")},
+        }
+    )
+    options = RunOptions(
+        root=None,
+        file=movie,
+        config_path=None,
+        restore_backup=None,
+        rerun_failed=None,
+        only_exts=[],
+        test_mode="verbose",
+        override_existing=False,
+        media_type=None,
     )
+    monkeypatch.setattr(run, "tmdb_search_best_match_with_candidates_scored", lambda **kwargs: None)
+    tv_match = tmdb_client.MatchCandidate(result={"id": 2}, score=8.5, votes=200, popularity=7.0, media_type="tv")
+    monkeypatch.setattr(run, "tmdb_search_best_tv_match_with_candidates_scored", lambda **kwargs: tv_match)
     monkeypatch.setattr(
         run,
         "tmdb_tv_details",
@@ -204,12 +221,67 @@ def test_cli_falls_back_to_tv_search(capsys, tmp_path: Path, monkeypatch) -> Non
         "tmdb_configuration",
         lambda *args, **kwargs: {"images": {"secure_base_url": "https://image.tmdb.org/t/p/", "poster_sizes": ["w185"]}},
     )
-    monkeypatch.setattr(run.time, "sleep", lambda *_args, **_kwargs: None)
-    monkeypatch.setenv("TMDB_API_KEY", "x")
-    monkeypatch.setattr(sys, "argv", ["main.py", "--config", str(cfg_path), "--root", str(root), "--test", "verbose"])
 
-    exit_code = main.main()
+    exit_code = run.run(options, cfg)
 
     out = capsys.readouterr().out
     assert exit_code == 0
     assert "TMDb TV: matched 'Amelie' (2001)" in out
+
+
+class _NoProbeInspector(MediaInspector):
+    def _load_probe(self, input_path: Path) -> None:
+        self._format_tags_cache[input_path] = {}
+        self._streams_cache[input_path] = []
+
+
+def test_run_records_batched_mp4tags_results(capsys, tmp_path: Path, monkeypatch, mock_tmdb) -> None:
+    root = tmp_path / "movies"
+    root.mkdir()
+    for name in ("Good (1986).m4v", "Bad (1986).m4v"):
+        (root / name).write_bytes(b"data")
+    cfg = config_from_dict(
+        {
+            "tmdb": {"api_key": "x", "min_score": 0.1},
+            "scan": {"extensions": [".m4v"]},
+            "write": {
+                "enabled": True,
+                "backup_original": False,
+                "backup_dir": str(tmp_path / "logs"),
+                "cover_art_enabled": False,
+                "metadata_tool": "mp4tags",
+            },
+        }
+    )
+    options = RunOptions(
+        root=root,
+        file=None,
+        config_path=None,
+        restore_backup=None,
+        rerun_failed=None,
+        only_exts=[],
+        test_mode=None,
+        override_existing=True,
+        media_type=None,
+    )
+
+    def fake_run_mp4tags(cmd):
+        return (1, "bad atom", None) if cmd[-1].endswith("Bad (1986).m4v") else (0, "", None)
+
+    monkeypatch.setattr(run, "MediaInspector", _NoProbeInspector)
+    monkeypatch.setattr(run, "ffmpeg_backup_metadata", lambda **_kwargs: None)
+    monkeypatch.setattr(run, "ffmpeg_write_metadata", lambda **_kwargs: True)
+    monkeypatch.setattr(itunes_writer, "mutagen_write_batch", lambda **_kwargs: True)
+    monkeypatch.setattr(mp4tags_batch, "run_mp4tags", fake_run_mp4tags)
+
+    exit_code = run.run(options, cfg)
+
+    out = capsys.readouterr().out
+    (manifest,) = (tmp_path / "logs").glob("*/manifest.jsonl")
+    records = {Path(record["path"]).name: record for record in map(json.loads, manifest.read_text().splitlines())}
+    assert exit_code == 1
+    assert records["Good (1986).m4v"]["status"] == "ok"
+    assert records["Bad (1986).m4v"]["status"] == "failed"
+    assert "Updated/Processed: 1" in out
+    assert "Failed:            1" in out
+
@@ -1,3 +1,4 @@
+from core import mapping_engine
 from core.mapping_engine import extract_jsonpath
 
 
@@ -14,3 +15,22 @@ def test_extract_jsonpath_handles_wildcards_and_filters() -> None:
     assert extract_jsonpath(payload, "$.genres[*].name") == ["Action", "Drama"]
     assert extract_jsonpath(payload, "$.crew[?(@.job=='Director')].name") == ["Pat Doe"]
     assert extract_jsonpath(payload, "$.posters[0].file_path") == "/poster.jpg"
+
+
+def test_extract_jsonpath_parses_each_expression_once() -> None:
+    mapping_engine._parse_jsonpath.cache_clear()
+    payloads = [{"genres": [{"name": "Action"}]}, {"genres": [{"name": "Drama"}]}, {"genres": []}]
+
+    results = [extract_jsonpath(payload, "$.genres[*].name") for payload in payloads]
+
+    assert results == [["Action"], ["Drama"], []]
+    info = mapping_engine._parse_jsonpath.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_extract_jsonpath_rejects_unsupported_expressions() -> None:
+    payload = {"genres": [{"name": "Action"}]}
+
+    assert extract_jsonpath(payload, "genres") is None
+    assert extract_jsonpath(payload, "$.genres[-1]") == []
+    assert extract_jsonpath(payload, "$.genres[9]") is None
@@ -1,32 +1,37 @@
+import pytest
+
 from core.matching import build_search_candidates, clean_filename_for_search, is_extras_title
 
 
-def test_clean_filename_for_search_examples() -> None:
-    tokens = [
-        "1080p",
-        "x264",
-        "bluray",
-        "webrip",
-        "hdrip",
-        "dts",
-        "yify",
-        "rarbg",
-    ]
-    cases = [
-        ("The.Matrix.1999.1080p.BluRay.x264", ("The Matrix", 1999)),
-        ("Ace Ventura_ Pet Detective", ("Ace Ventura Pet Detective", None)),
-        ("The Godfather Part II D1 1974", ("The Godfather Part II", 1974)),
-        ("LOTR Fellowship Ext D1", ("Lord of the Rings Fellowship", None)),
-        ("Top Gun (1986) 1080p BluRay x264", ("Top Gun", 1986)),
-        ("Top Gun [1986]", ("Top Gun", 1986)),
-        ("Top Gun (1986)", ("Top Gun", 1986)),
-        ("Kill Bill V2", ("Kill Bill Vol 2", None)),
-        ("Sex and the City s1v2", ("Sex and the City", None)),
-        ("Lions For Lambs [WS]", ("Lions For Lambs", None)),
-        ("300", ("300", None)),
-    ]
-    for stem, expected in cases:
-        assert clean_filename_for_search(stem, tokens) == expected
+_STRIP_TOKENS = [
+    "1080p",
+    "x264",
+    "bluray",
+    "webrip",
+    "hdrip",
+    "dts",
+    "yify",
+    "rarbg",
+]
+
+_CLEAN_FILENAME_CASES = [
+    ("The.Matrix.1999.1080p.BluRay.x264", ("The Matrix", 1999)),
+    ("Ace Ventura_ Pet Detective", ("Ace Ventura Pet Detective", None)),
+    ("The Godfather Part II D1 1974", ("The Godfather Part II", 1974)),
+    ("LOTR Fellowship Ext D1", ("Lord of the Rings Fellowship", None)),
+    ("Top Gun (1986) 1080p BluRay x264", ("Top Gun", 1986)),
+    ("Top Gun [1986]", ("Top Gun", 1986)),
+    ("Top Gun (1986)", ("Top Gun", 1986)),
+    ("Kill Bill V2", ("Kill Bill Vol 2", None)),
+    ("Sex and the City s1v2", ("Sex and the City", None)),
+    ("Lions For Lambs [WS]", ("Lions For Lambs", None)),
+    ("300", ("300", None)),
+]
+
+
+@pytest.mark.parametrize(("stem", "expected"), _CLEAN_FILENAME_CASES)
+def test_clean_filename_for_search_examples(stem: str, expected) -> None:
+    assert clean_filename_for_search(stem, _STRIP_TOKENS) == expected
 
 
 def test_build_search_candidates_splits_and_corrects() -> None:
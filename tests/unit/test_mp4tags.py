@@ -0,0 +1,119 @@
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from core.writers import mp4tags, mp4tags_batch
+
+
+def test_mp4tags_write_metadata_builds_cmd(monkeypatch) -> None:
+    calls = []
+
+    def fake_run(cmd, **_kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
+
+    monkeypatch.setattr(mp4tags.subprocess, "run", fake_run)
+
+    wrote = mp4tags.mp4tags_write_metadata(
+        mp4tags_path="mp4tags",
+        input_path=Path("movie.m4v"),
+        tags={
+            "title": "Top Gun",
+            "genre": "Action",
+            "media_type": "Feature Film",
+            "description": ["", "A pilot story."],
+            "unknown": "ignored",
+            "iTunMOVI": "<plist/>",
+        },
+        log_path=None,
+        clear_metadata=False,
+        dry_run=False,
+        test_mode=False,
+    )
+
+    assert wrote is True
+    assert calls == [["mp4tags", "-s", "Top Gun", "-i", "featurefilm", "-l", "A pilot story.", "movie.m4v"]]
+
+
+def _submit_all(batcher: mp4tags_batch.Mp4tagsBatcher, names: tuple[str, ...]) -> None:
+    for name in names:
+        batcher.submit(
+            mp4tags_path="mp4tags",
+            input_path=Path(name),
+            tags={"title": name},
+            log_path=None,
+            clear_metadata=False,
+            on_complete=lambda ok, name=name: (name, ok),
+        )
+
+
+def test_mp4tags_batcher_flush_invokes_callbacks(monkeypatch) -> None:
+    reported_on: list[threading.Thread] = []
+    report = mp4tags_batch.report_mp4tags_result
+
+    def fake_run(cmd):
+        return (1, "bad atom", None) if cmd[-1] == "bad.m4v" else (0, "", None)
+
+    def recording_report(*args):
+        reported_on.append(threading.current_thread())
+        return report(*args)
+
+    monkeypatch.setattr(mp4tags_batch, "run_mp4tags", fake_run)
+    monkeypatch.setattr(mp4tags_batch, "report_mp4tags_result", recording_report)
+
+    batcher = mp4tags_batch.Mp4tagsBatcher(max_workers=2)
+    _submit_all(batcher, ("good.m4v", "bad.m4v"))
+
+    assert batcher.is_pending(Path("good.m4v"))
+    assert batcher.close() == [("good.m4v", True), ("bad.m4v", False)]
+    assert not batcher.is_pending(Path("good.m4v"))
+    assert reported_on == [threading.current_thread()] * 2
+
+
+def test_mp4tags_batcher_collect_done_leaves_running_writes(monkeypatch) -> None:
+    release = threading.Event()
+
+    def fake_run(cmd):
+        if cmd[-1] == "slow.m4v":
+            release.wait(5)
+        return 0, "", None
+
+    monkeypatch.setattr(mp4tags_batch, "run_mp4tags", fake_run)
+
+    batcher = mp4tags_batch.Mp4tagsBatcher(max_workers=2)
+    _submit_all(batcher, ("slow.m4v", "fast.m4v"))
+
+    collected: list = []
+    deadline = time.monotonic() + 5
+    while not collected and time.monotonic() < deadline:
+        collected = batcher.collect_done()
+
+    assert collected == [("fast.m4v", True)]
+    assert batcher.is_pending(Path("slow.m4v"))
+    assert not batcher.is_pending(Path("fast.m4v"))
+
+    release.set()
+    assert batcher.close() == [("slow.m4v", True)]
+
+
+def test_mp4tags_write_metadata_decodes_stderr_on_failure(monkeypatch, tmp_path) -> None:
+    def fake_run(cmd, stdout, stderr):
+        assert stdout is mp4tags.subprocess.DEVNULL
+        return SimpleNamespace(returncode=1, stderr="bad atom \xe9".encode("utf-8"))
+
+    monkeypatch.setattr(mp4tags.subprocess, "run", fake_run)
+    log_path = tmp_path / "run.log"
+
+    wrote = mp4tags.mp4tags_write_metadata(
+        mp4tags_path="mp4tags",
+        input_path=Path("movie.m4v"),
+        tags={"title": "Top Gun"},
+        log_path=log_path,
+        clear_metadata=False,
+        dry_run=False,
+        test_mode=False,
+    )
+
+    assert wrote is False
+    assert "bad atom \xe9" in log_path.read_text(encoding="utf-8")
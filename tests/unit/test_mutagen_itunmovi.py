@@ -0,0 +1,59 @@
+from pathlib import Path
+
+from core.writers import mutagen_itunmovi
+from log_append import close_log
+
+
+class _FakeMP4:
+    instances: list["_FakeMP4"] = []
+
+    def __init__(self, _path: str) -> None:
+        self.tags: dict = {}
+        self.saves = 0
+        _FakeMP4.instances.append(self)
+
+    def save(self) -> None:
+        self.saves += 1
+
+
+def test_mutagen_write_batch_saves_once(monkeypatch) -> None:
+    _FakeMP4.instances = []
+    monkeypatch.setattr(mutagen_itunmovi, "MP4", _FakeMP4)
+
+    wrote = mutagen_itunmovi.mutagen_write_batch(
+        input_path=Path("movie.m4v"),
+        itunmovi_bytes=b"<plist/>",
+        director=["", "Tony Scott"],
+        log_path=None,
+        dry_run=False,
+        test_mode=False,
+    )
+
+    assert wrote is True
+    assert len(_FakeMP4.instances) == 1
+    mp4 = _FakeMP4.instances[0]
+    assert mp4.saves == 1
+    assert mp4.tags["\xa9dir"] == ["Tony Scott"]
+    assert "----:com.apple.iTunes:iTunMOVI" in mp4.tags
+
+
+def test_mutagen_write_batch_logs_combined_label(monkeypatch, tmp_path: Path) -> None:
+    class _FailingMP4(_FakeMP4):
+        def save(self) -> None:
+            raise OSError("read-only")
+
+    monkeypatch.setattr(mutagen_itunmovi, "MP4", _FailingMP4)
+    log_path = tmp_path / "run.log"
+
+    wrote = mutagen_itunmovi.mutagen_write_batch(
+        input_path=Path("movie.m4v"),
+        itunmovi_bytes=b"<plist/>",
+        director="Tony Scott",
+        log_path=log_path,
+        dry_run=False,
+        test_mode=False,
+    )
+    close_log(log_path)
+
+    assert wrote is False
+    assert log_path.read_text() == "[iTunMOVI + director] movie.m4v\nerror: read-only\n"
@@ -4,7 +4,18 @@ from core.services import write_pipeline
 def test_filter_existing_tags_skips_present_values() -> None:
     tags = {"title": "Top Gun", "genre": "Action"}
     existing = {"title": "Existing Title"}
-    filtered, skipped = write_pipeline.filter_existing_tags(tags, existing)
+    filtered, skipped, is_noop = write_pipeline.filter_existing_tags(tags, existing)
 
     assert filtered == {"genre": "Action"}
     assert skipped == ["title"]
+    assert is_noop is False
+
+
+def test_filter_existing_tags_reports_noop_when_all_present() -> None:
+    tags = {"title": "Top Gun"}
+    existing = {"title": "Top Gun "}
+    filtered, skipped, is_noop = write_pipeline.filter_existing_tags(tags, existing)
+
+    assert filtered == {}
+    assert skipped == ["title"]
+    assert is_noop is True
@@ -1,6 +1,14 @@
 from pathlib import Path
 
-from core.services.run_artifacts import cleanup_run_dirs, setup_run_dirs
+from core.services.run_artifacts import (
+    append_run_log,
+    cleanup_run_dirs,
+    close_run_log,
+    load_failed_from_manifest,
+    setup_run_dirs,
+    write_log_header,
+    write_manifest_record,
+)
 
 
 def test_cleanup_run_dirs_removes_previous_runs(tmp_path: Path) -> None:
@@ -21,3 +29,26 @@ def test_setup_run_dirs_cleans_then_creates(tmp_path: Path) -> None:
     assert run_dirs.run_backup_dir is not None
     assert run_dirs.run_backup_dir.exists()
     assert (tmp_path / "20250101-010101").exists()
+
+
+def test_append_run_log_reuses_handle(tmp_path: Path) -> None:
+    log_path = tmp_path / "run" / "run.log"
+    write_log_header(log_path, tmp_path / "run")
+
+    append_run_log(log_path, "first\n\nsecond")
+    append_run_log(log_path, "third")
+    close_run_log(log_path)
+
+    contents = log_path.read_text(encoding="utf-8")
+    assert contents.startswith("Video Metadata Tagger Log\n")
+    assert contents.endswith("- first\n- second\n- third\n")
+
+
+def test_manifest_round_trip_returns_failed_paths(tmp_path: Path) -> None:
+    manifest = tmp_path / "run" / "manifest.jsonl"
+    write_manifest_record(manifest, {"path": "/movies/ok.m4v", "status": "ok", "mtime": 1.5})
+    write_manifest_record(manifest, {"path": "/movies/Amélie.m4v", "status": "failed", "size": None})
+    with manifest.open("a", encoding="utf-8") as f:
+        f.write("\nnot json\n")
+
+    assert load_failed_from_manifest(manifest) == [Path("/movies/Amélie.m4v")]
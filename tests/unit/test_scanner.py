@@ -0,0 +1,17 @@
+from pathlib import Path
+
+from core.files.scanner import find_movie_files
+
+
+def test_find_movie_files_filters_and_orders_like_rglob(tmp_path: Path) -> None:
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "Inner.M4V").write_bytes(b"x")
+    (tmp_path / "b" / "sample.m4v").write_bytes(b"x")
+    (tmp_path / "Top.mp4").write_bytes(b"x")
+    (tmp_path / "notes.txt").write_bytes(b"x")
+    (tmp_path / "a.m4v.part").write_bytes(b"x")
+
+    files = find_movie_files(tmp_path, [".m4v", ".mp4"], ["SAMPLE"], 0)
+
+    assert files == [tmp_path / "Top.mp4", tmp_path / "b" / "Inner.M4V"]
+    assert find_movie_files(tmp_path, [".m4v", ".mp4"], [], 1) == [tmp_path / "Top.mp4"]
@@ -1,3 +1,6 @@
+import json
+
+from core.providers.tmdb import client as tmdb_client
 from core.providers.tmdb.client import MatchCandidate, choose_preferred_match, normalize_title, title_similarity
 from core.providers.tmdb.helpers import build_image_url, select_image_size
 
@@ -46,3 +49,45 @@ def test_build_image_url_formats_path() -> None:
         build_image_url("https://image.tmdb.org/t/p/", "w185", "/poster.jpg")
         == "https://image.tmdb.org/t/p/w185/poster.jpg"
     )
+
+
+def test_create_tmdb_session_sets_headers_and_retries() -> None:
+    session = tmdb_client.create_tmdb_session()
+
+    assert session.headers["Accept"] == "application/json"
+    adapter = session.get_adapter("https://api.themoviedb.org/3/configuration")
+    assert adapter.max_retries.total == 3
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.raise_on_status is False
+
+
+def test_tmdb_request_reuses_responses_per_session(monkeypatch) -> None:
+    session = tmdb_client.create_tmdb_session()
+    calls = []
+
+    class FakeResponse:
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self):
+            return {"results": [{"id": len(calls)}]}
+
+        @property
+        def content(self) -> bytes:
+            return json.dumps(self.json()).encode("utf-8")
+
+    def fake_get(url, params, timeout):
+        calls.append((url, params["query"]))
+        return FakeResponse()
+
+    monkeypatch.setattr(session, "get", fake_get)
+
+    assert tmdb_client.is_cached_request(session, "/search/movie", {"query": "Top Gun"}) is False
+    first = tmdb_client.tmdb_request(session, "key", "/search/movie", {"query": "Top Gun"})
+    assert tmdb_client.is_cached_request(session, "/search/movie", {"query": "Top Gun"}) is True
+    again = tmdb_client.tmdb_request(session, "key", "/search/movie", {"query": "Top Gun"})
+    other = tmdb_client.tmdb_request(session, "key", "/search/tv", {"query": "Top Gun"})
+
+    assert first is again
+    assert other == {"results": [{"id": 2}]}
+    assert len(calls) == 2
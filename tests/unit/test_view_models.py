@@ -0,0 +1,31 @@
+from core.providers.tmdb.view_models import TmdbTvMetadata
+
+
+def test_tv_metadata_joins_names_and_falls_back_to_networks() -> None:
+    show = {
+        "id": 7,
+        "name": "Chappelle's Show",
+        "first_air_date": "2003-01-22",
+        "genres": [{"name": "Comedy"}, {"name": ""}, {}],
+        "networks": [{"name": "Comedy Central"}],
+        "spoken_languages": [{"english_name": "English"}, {"english_name": None}],
+        "origin_country": ["US", ""],
+    }
+
+    metadata = TmdbTvMetadata.from_tmdb(show, 500)
+
+    assert metadata.genres_joined == "Comedy"
+    assert metadata.production_companies_joined == "Comedy Central"
+    assert metadata.networks_joined == "Comedy Central"
+    assert metadata.spoken_languages_joined == "English"
+    assert metadata.origin_countries_joined == "US"
+    assert metadata.release_year == "2003"
+
+
+def test_tv_metadata_uses_slots_and_builds_context() -> None:
+    metadata = TmdbTvMetadata.from_tmdb({"id": 7, "name": "Show", "number_of_seasons": 2}, 500)
+
+    assert not hasattr(metadata, "__dict__")
+    context = metadata.to_context()
+    assert context["title"] == "Show"
+    assert context["number_of_seasons"] == "2"
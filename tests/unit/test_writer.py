@@ -1,12 +1,17 @@
+import os
+import sys
 from datetime import datetime
 from pathlib import Path
 
+from ffmpeg import writer
 from ffmpeg.backups import (
     backup_metadata_path,
+    backup_original_path,
     create_run_backup_dir,
     ffmpeg_backup_metadata,
     ffmpeg_restore_metadata,
 )
+from log_append import close_all_logs
 
 
 class _Proc:
@@ -15,6 +20,28 @@ class _Proc:
         self.stderr = ""
 
 
+def _write(input_path: Path, **overrides) -> bool:
+    kwargs = dict(
+        ffmpeg_path="ffmpeg",
+        input_path=input_path,
+        tags={"title": "Top Gun"},
+        cover_art_path=None,
+        ffmpeg_analyzeduration=None,
+        ffmpeg_probe_size=None,
+        log_path=None,
+        clear_metadata=False,
+        clear_tags=None,
+        backup_original=False,
+        backup_path=None,
+        backup_suffix=".bak",
+        atomic_replace=True,
+        dry_run=False,
+        test_mode=False,
+    )
+    kwargs.update(overrides)
+    return writer.ffmpeg_write_metadata(**kwargs)
+
+
 def test_create_run_backup_dir_uses_timestamp(tmp_path: Path) -> None:
     base = tmp_path / "logs"
     now = datetime(2024, 1, 2, 3, 4, 5)
@@ -31,9 +58,17 @@ def test_backup_metadata_path_uses_relative_path(tmp_path: Path) -> None:
     assert backup_metadata_path(backup_dir, input_path, root) == expected
 
 
+def test_backup_original_path_falls_back_to_name_outside_root(tmp_path: Path) -> None:
+    input_path = tmp_path / "elsewhere" / "Top Gun (1986).m4v"
+    backup_dir = tmp_path / "logs" / "run"
+    expected = backup_dir / "Top Gun (1986).m4v.bak"
+    assert backup_original_path(backup_dir, input_path, tmp_path / "root", ".bak") == expected
+    assert backup_original_path(backup_dir, input_path, None, ".bak") == expected
+
+
 def test_ffmpeg_backup_metadata_invokes_ffmpeg(tmp_path: Path, monkeypatch) -> None:
     input_path = tmp_path / "movie.m4v"
-    input_path.write_text("data", encoding="utf-8")
+    input_path.write_bytes(b"data")
     backup_dir = tmp_path / "logs"
     calls = []
 
@@ -58,7 +93,7 @@ def test_ffmpeg_backup_metadata_invokes_ffmpeg(tmp_path: Path, monkeypatch) -> N
 
 def test_ffmpeg_restore_metadata_invokes_ffmpeg(tmp_path: Path, monkeypatch) -> None:
     input_path = tmp_path / "movie.m4v"
-    input_path.write_text("data", encoding="utf-8")
+    input_path.write_bytes(b"data")
     metadata_path = tmp_path / "movie.m4v.ffmeta"
     metadata_path.write_text("FFMETADATA1\n", encoding="utf-8")
     calls = []
@@ -80,3 +115,182 @@ def test_ffmpeg_restore_metadata_invokes_ffmpeg(tmp_path: Path, monkeypatch) ->
 
     assert restored is True
     assert calls
+
+
+def test_run_ffmpeg_keeps_stderr_tail() -> None:
+    script = "import sys; sys.stderr.write('x' * 200000 + 'codec mjpeg'); sys.exit(3)"
+    returncode, stderr_tail = writer._run_ffmpeg([sys.executable, "-c", script])
+
+    assert returncode == 3
+    assert len(stderr_tail) == writer._STDERR_TAIL_BYTES
+    assert stderr_tail.endswith(b"codec mjpeg")
+
+
+def test_reflink_or_copy_preserves_contents(tmp_path: Path) -> None:
+    src = tmp_path / "movie.m4v"
+    src.write_bytes(b"\x00\x01movie" * 1000)
+    dst = tmp_path / "backup" / "movie.m4v.bak"
+    dst.parent.mkdir()
+
+    writer._reflink_or_copy(src, dst)
+
+    assert dst.read_bytes() == src.read_bytes()
+    assert dst.stat().st_mtime == src.stat().st_mtime
+
+
+def test_ffmpeg_write_metadata_removes_stale_tagtmp(tmp_path: Path) -> None:
+    input_path = tmp_path / "movie.m4v"
+    input_path.write_bytes(b"data")
+    stale = tmp_path / "movie.tagtmp.abc123.m4v"
+    stale.write_bytes(b"")
+    other = tmp_path / "movie2.tagtmp.abc123.m4v"
+    other.write_bytes(b"")
+
+    wrote = _write(input_path, dry_run=True)
+
+    assert wrote is True
+    assert not stale.exists()
+    assert other.exists()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["movie.m4v", "movie2.tagtmp.abc123.m4v"]
+
+
+def test_ffmpeg_write_metadata_retries_without_cover_art(tmp_path: Path, monkeypatch) -> None:
+    input_path = tmp_path / "movie.m4v"
+    input_path.write_bytes(b"data")
+    cover = tmp_path / "cover.jpg"
+    cover.write_bytes(b"jpg")
+    calls = []
+
+    def fake_run_ffmpeg(cmd):
+        calls.append(cmd)
+        if len(calls) == 1:
+            return 1, b"Could not find tag for Codec MJPEG in stream #1"
+        Path(cmd[-1]).write_bytes(b"tagged")
+        return 0, b""
+
+    monkeypatch.setattr(writer, "_run_ffmpeg", fake_run_ffmpeg)
+
+    wrote = _write(input_path, cover_art_path=cover)
+
+    assert wrote is True
+    assert len(calls) == 2
+    assert str(cover) not in calls[1]
+    assert "title=Top Gun" in calls[1]
+    assert input_path.read_bytes() == b"tagged"
+
+
+def test_ffmpeg_write_metadata_builds_metadata_args(tmp_path: Path, monkeypatch) -> None:
+    input_path = tmp_path / "movie.m4v"
+    input_path.write_bytes(b"data")
+    calls = []
+
+    def fake_run_ffmpeg(cmd):
+        calls.append(cmd)
+        Path(cmd[-1]).write_bytes(b"tagged")
+        return 0, b""
+
+    monkeypatch.setattr(writer, "_run_ffmpeg", fake_run_ffmpeg)
+
+    _write(input_path, tags={"genre": "Action, Drama,", "keywords": ["fighter", " ", "navy"], "comment": ""})
+
+    cmd = calls[0]
+    metadata = [cmd[idx + 1] for idx, arg in enumerate(cmd) if arg == "-metadata"]
+    assert metadata == ["genre=Action", "genre=Drama", "keywords=fighter", "keywords=navy"]
+
+
+def test_reserve_tmp_path_creates_unique_tagtmp(tmp_path: Path) -> None:
+    input_path = tmp_path / "movie.m4v"
+    first = writer._reserve_tmp_path(input_path)
+    second = writer._reserve_tmp_path(input_path)
+
+    assert first != second
+    assert first.exists() and first.stat().st_size == 0
+    assert first.name.startswith("movie.tagtmp.") and first.suffix == ".m4v"
+
+
+def _swapping_renameat2(calls: list):
+    def renameat2(_src_dir, src, _dest_dir, dest, flags):
+        calls.append(flags)
+        src_path, dest_path = Path(os.fsdecode(src)), Path(os.fsdecode(dest))
+        src_bytes, dest_bytes = src_path.read_bytes(), dest_path.read_bytes()
+        src_path.write_bytes(dest_bytes)
+        dest_path.write_bytes(src_bytes)
+        return 0
+
+    return renameat2
+
+
+def test_exchange_into_place_swaps_files(tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "movie.tagtmp.abc.m4v"
+    dest = tmp_path / "movie.m4v"
+    src.write_bytes(b"new")
+    dest.write_bytes(b"old")
+    calls: list = []
+    monkeypatch.setattr(writer, "_renameat2", lambda: _swapping_renameat2(calls))
+
+    assert writer._exchange_into_place(src, dest) is True
+    assert calls == [writer._RENAME_EXCHANGE]
+    assert dest.read_bytes() == b"new"
+    assert not src.exists()
+
+
+def test_exchange_into_place_declines_when_rejected(tmp_path: Path, monkeypatch) -> None:
+    src = tmp_path / "movie.tagtmp.abc.m4v"
+    dest = tmp_path / "movie.m4v"
+    src.write_bytes(b"new")
+    dest.write_bytes(b"old")
+    monkeypatch.setattr(writer, "_renameat2", lambda: lambda *_args: -1)
+
+    assert writer._exchange_into_place(src, dest) is False
+    assert dest.read_bytes() == b"old"
+    assert src.read_bytes() == b"new"
+
+
+def test_ffmpeg_write_metadata_falls_back_to_replace_when_exchange_declined(tmp_path: Path, monkeypatch) -> None:
+    input_path = tmp_path / "movie.m4v"
+    input_path.write_bytes(b"data")
+    replaced: list[tuple[str, str]] = []
+    real_replace = Path.replace
+
+    def fake_run_ffmpeg(cmd):
+        Path(cmd[-1]).write_bytes(b"tagged")
+        return 0, b""
+
+    def recording_replace(self, target):
+        replaced.append((self.name, Path(target).name))
+        return real_replace(self, target)
+
+    monkeypatch.setattr(writer, "_run_ffmpeg", fake_run_ffmpeg)
+    monkeypatch.setattr(writer, "_renameat2", lambda: lambda *_args: -1)
+    monkeypatch.setattr(Path, "replace", recording_replace)
+
+    assert _write(input_path) is True
+    assert len(replaced) == 1
+    assert replaced[0][0].startswith("movie.tagtmp.") and replaced[0][1] == "movie.m4v"
+    assert input_path.read_bytes() == b"tagged"
+    assert [path.name for path in tmp_path.iterdir()] == ["movie.m4v"]
+
+
+def test_ffmpeg_write_metadata_rejects_empty_output(tmp_path: Path, monkeypatch) -> None:
+    input_path = tmp_path / "movie.m4v"
+    input_path.write_bytes(b"data")
+    monkeypatch.setattr(writer, "_run_ffmpeg", lambda _cmd: (0, b""))
+
+    wrote = _write(input_path)
+
+    assert wrote is False
+    assert input_path.read_bytes() == b"data"
+    assert [path.name for path in tmp_path.iterdir()] == ["movie.m4v"]
+
+
+def test_ffmpeg_failure_is_logged_through_shared_handle(tmp_path: Path, monkeypatch) -> None:
+    input_path = tmp_path / "movie.m4v"
+    input_path.write_bytes(b"data")
+    log_path = tmp_path / "run" / "run.log"
+    monkeypatch.setattr(writer, "_run_ffmpeg", lambda _cmd: (1, b"boom"))
+
+    wrote = _write(input_path, log_path=log_path)
+    close_all_logs()
+
+    assert wrote is False
+    assert "stderr:\nboom\n" in log_path.read_text(encoding="utf-8")